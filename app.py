@@ -1,43 +1,47 @@
-import customtkinter as ctk
+from startup import startup_report, lazy_import
+
+with startup_report.timing("customtkinter"):
+    import customtkinter as ctk
+import abc
 import json
 import os
 import threading
 import time
-import requests
 import sys
 import webbrowser
 import subprocess
-import pyautogui
 import re
-import base64
-import urllib.parse
-import urllib3
-import unicodedata
 from tkinter import filedialog, messagebox
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
-from PIL import Image
 from datetime import datetime
-from cryptography.fernet import Fernet
-
-# SSL Uyarılarını Gizle
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-# --- AYARLAR ---
-DATA_FILE = "accounts_db.json"
-CONFIG_FILE = "config.json"
-KEY_FILE = "secret.key"
-CACHE_DIR = "assets/cache"
+with startup_report.timing("lcu"):
+    from lcu import (
+        lcu_handler, LCUEventClient, ChampSelectState, PollScheduler,
+        GAMEFLOW_PHASE_URI, READY_CHECK_URI, CHAMP_SELECT_URI
+    )
+with startup_report.timing("scraper"):
+    from scraper import (
+        make_rank_checker, build_profile_url, rank_cache,
+        SCRAPE_WORKERS, SCRAPE_RATE, SCRAPE_BURST, RANK_CACHE_TTL
+    )
+from riot_client import RiotClientReadiness, LOGIN_READY, LOGGED_IN
+with startup_report.timing("ddragon"):
+    from ddragon import load_cached_champions, refresh_champions, FALLBACK_CHAMPIONS
+from crypto import cipher_man
+from store import AccountStore, AccountEvents, apply_account_defaults
+from search import AccountSearchIndex, ChampionIndex, rank_score, INDEXED_FIELDS
+from images import ImageCache, image_cache, asset_path
+from ui_dispatch import UIDispatcher, RingLog
+from utils import (
+    CONFIG_FILE, CACHE_DIR,
+    ensure_cache_dir
+)
+
+# ağır modüller ilk kullanımda yüklenir (auto-login)
+pyautogui = lazy_import("pyautogui")
 
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
-RANK_ORDER = {
-    "CHALLENGER": 9000, "GRANDMASTER": 8000, "MASTER": 7000,
-    "DIAMOND": 6000, "EMERALD": 5000, "PLATINUM": 4000,
-    "GOLD": 3000, "SILVER": 2000, "BRONZE": 1000, "IRON": 0, "UNRANKED": -1
-}
-
 RANK_COLORS = {
     "IRON": "#7a7a7a", "BRONZE": "#8c7853", "SILVER": "#d3d3d3",
     "GOLD": "#DAA520", "PLATINUM": "#00CED1", "EMERALD": "#2ecc71",
@@ -45,12 +49,15 @@ RANK_COLORS = {
     "CHALLENGER": "#F1C40F", "UNRANKED": "gray"
 }
 
-def resource_path(relative_path):
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+SEARCH_DEBOUNCE_MS = 150
+# pause between the keystroke steps of auto-login, so the form can follow
+LOGIN_STEP_DELAY_MS = 500
+# fields an AccountCard shows; other changes (level, BE, RP...) don't touch the list
+CARD_FIELDS = frozenset({"riot_id", "winrate", "rank_tier", "rank_div", "lp"})
+# fields fetch_and_save_stats fills from the LCU, shown in the details window
+STATS_FIELDS = frozenset({"level", "skin_count", "blue_essence", "rp"})
+# seconds a matched stats refresh is reused when a details window opens
+STATS_FRESHNESS = 30
 
 def get_cursor():
     if sys.platform == "darwin":
@@ -58,138 +65,10 @@ def get_cursor():
     else:
         return "hand2"
 
-def ensure_cache_dir():
-    if not os.path.exists(CACHE_DIR):
-        os.makedirs(CACHE_DIR)
-
-def normalize_id(riot_id):
-    if not riot_id:
-        return ""
-    text = riot_id.strip().lower()
-    turkish_map = {
-        "ı": "i", "İ": "i", "ğ": "g", "Ğ": "g",
-        "ü": "u", "Ü": "u", "ş": "s", "Ş": "s",
-        "ö": "o", "Ö": "o", "ç": "c", "Ç": "c",
-    }
-    for k, v in turkish_map.items():
-        text = text.replace(k, v)
-    # remove combining marks (e.g. i + dot)
-    text = ''.join(
-        ch for ch in unicodedata.normalize("NFD", text)
-        if unicodedata.category(ch) != "Mn"
-    )
-    text = text.replace(" ", "")
-    return text
-
-def slugify_for_url(text):
-    """Türkçe karakterleri League of Graphs uyumlu hale getirir"""
-    replacements = {
-        "ı": "i", "İ": "i", "ğ": "g", "Ğ": "g",
-        "ü": "u", "Ü": "u", "ş": "s", "Ş": "s",
-        "ö": "o", "Ö": "o", "ç": "c", "Ç": "c",
-        " ": "+"
-    }
-    for search, replace in replacements.items():
-        text = text.replace(search, replace)
-    return text
-
 ensure_cache_dir()
 
 # --------------------------
 
-class CipherManager:
-    def __init__(self):
-        self.key = self.load_key()
-        self.cipher = Fernet(self.key)
-
-    def load_key(self):
-        if os.path.exists(KEY_FILE):
-            with open(KEY_FILE, "rb") as f:
-                return f.read()
-        else:
-            key = Fernet.generate_key()
-            with open(KEY_FILE, "wb") as f:
-                f.write(key)
-            return key
-
-    def encrypt(self, text):
-        return self.cipher.encrypt(text.encode()).decode()
-
-    def decrypt(self, encrypted_text):
-        try:
-            return self.cipher.decrypt(encrypted_text.encode()).decode()
-        except:
-            return encrypted_text
-
-cipher_man = CipherManager()
-
-# --- LCU Handler ---
-class LCUHandler:
-    def __init__(self):
-        self.port = None
-        self.password = None
-        self.protocol = "https"
-        self.connected = False
-        self.headers = {}
-
-    def try_connect(self):
-        possible_paths = []
-        if sys.platform == "darwin":
-            possible_paths = [
-                "/Applications/League of Legends.app/Contents/LoL/lockfile",
-                "/Applications/Riot Games/League of Legends.app/Contents/LoL/lockfile"
-            ]
-        else:
-            possible_paths = [
-                "C:\\Riot Games\\League of Legends\\lockfile",
-                "D:\\Riot Games\\League of Legends\\lockfile"
-            ]
-
-        lockfile_path = None
-        for p in possible_paths:
-            if os.path.exists(p):
-                lockfile_path = p
-                break
-
-        if not lockfile_path:
-            return False
-
-        try:
-            with open(lockfile_path, 'r') as f:
-                data = f.read().split(':')
-                self.port = data[2]
-                self.password = data[3]
-                self.protocol = data[4]
-
-                auth_str = f"riot:{self.password}"
-                auth_b64 = base64.b64encode(auth_str.encode()).decode()
-                self.headers = {
-                    "Authorization": f"Basic {auth_b64}",
-                    "Accept": "application/json"
-                }
-                self.connected = True
-                return True
-        except:
-            self.connected = False
-            return False
-
-    def request(self, method, endpoint, data=None):
-        if not self.connected:
-            return None
-        url = f"{self.protocol}://127.0.0.1:{self.port}{endpoint}"
-        try:
-            if method == "GET":
-                return requests.get(url, headers=self.headers, verify=False)
-            elif method == "POST":
-                return requests.post(url, headers=self.headers, json=data, verify=False)
-            elif method == "PATCH":
-                return requests.patch(url, headers=self.headers, json=data, verify=False)
-        except Exception:
-            self.connected = False
-            return None
-
-lcu_handler = LCUHandler()
-
 # --- GAME TOOLS WINDOW ---
 class GameToolsWindow(ctk.CTkToplevel):
     def __init__(self, parent):
@@ -288,10 +167,9 @@ class GameToolsWindow(ctk.CTkToplevel):
         )
         self.entry_search.pack(fill="x", padx=15, pady=(0, 10))
 
-        self.scroll_area = ctk.CTkScrollableFrame(pick_frame, fg_color="transparent")
-        self.scroll_area.pack(fill="both", expand=True, padx=5, pady=5)
+        self.champ_grid = ChampionGrid(pick_frame, self.champ_style, self.select_champion)
+        self.champ_grid.pack(fill="both", expand=True, padx=5, pady=5)
 
-        self.champ_buttons = {}
         self.create_champ_buttons()
 
     def update_lcu_status(self):
@@ -304,31 +182,16 @@ class GameToolsWindow(ctk.CTkToplevel):
         self.after(2000, self.update_lcu_status)
 
     def create_champ_buttons(self):
-        sorted_champs = sorted(self.my_parent.champions_map.keys())
-        for i, name in enumerate(sorted_champs):
-            btn = ctk.CTkButton(
-                self.scroll_area,
-                text=name,
-                height=32,
-                fg_color="#333",
-                hover_color="#444",
-                command=lambda n=name: self.select_champion(n)
-            )
-            btn.grid(row=i // 3, column=i % 3, padx=3, pady=3, sticky="ew")
-            self.champ_buttons[name] = btn
-        self.scroll_area.grid_columnconfigure(0, weight=1)
-        self.scroll_area.grid_columnconfigure(1, weight=1)
-        self.scroll_area.grid_columnconfigure(2, weight=1)
+        # butonlar ChampionGrid'in havuzundan, sadece görünen satırlar için
+        self.champ_index = ChampionIndex(self.my_parent.champions_map.keys())
+        self.filter_champions()
+
+    def refresh_champ_buttons(self):
+        self.create_champ_buttons()
+        self.update_champ_buttons()
 
     def filter_champions(self, *args):
-        query = self.search_var.get().lower()
-        visible_idx = 0
-        for name, btn in self.champ_buttons.items():
-            if query in name.lower():
-                btn.grid(row=visible_idx // 3, column=visible_idx % 3, padx=3, pady=3, sticky="ew")
-                visible_idx += 1
-            else:
-                btn.grid_forget()
+        self.champ_grid.set_items(self.champ_index.query(self.search_var.get()))
 
     def set_mode(self, mode):
         self.selection_target.set(mode)
@@ -340,6 +203,7 @@ class GameToolsWindow(ctk.CTkToplevel):
             self.btn_mode_ban.configure(fg_color="#e67e22", text_color="black")
 
     def select_champion(self, name):
+        changed = {name, self.my_parent.target_champ_name, self.my_parent.target_ban_name}
         champ_id = self.my_parent.champions_map[name]
         if self.selection_target.get() == "ban":
             self.my_parent.target_ban_name = name
@@ -351,16 +215,18 @@ class GameToolsWindow(ctk.CTkToplevel):
         self.lbl_selected.configure(
             text=f"Pick: {self.my_parent.target_champ_name}   |   Ban: {self.my_parent.target_ban_name}"
         )
-        self.update_champ_buttons()
+        # sadece eski ve yeni seçili butonlar yeniden boyanır
+        self.champ_grid.restyle(changed)
 
     def update_champ_buttons(self):
-        for n, btn in self.champ_buttons.items():
-            if n == self.my_parent.target_champ_name:
-                btn.configure(fg_color="#2ecc71", hover_color="#27ae60", text_color="black")
-            elif n == self.my_parent.target_ban_name:
-                btn.configure(fg_color="#e67e22", hover_color="#d35400", text_color="black")
-            else:
-                btn.configure(fg_color="#333", hover_color="#444", text_color="white")
+        self.champ_grid.restyle(set(self.champ_grid.slot_names))
+
+    def champ_style(self, name):
+        if name == self.my_parent.target_champ_name:
+            return {"fg_color": "#2ecc71", "hover_color": "#27ae60", "text_color": "black"}
+        if name == self.my_parent.target_ban_name:
+            return {"fg_color": "#e67e22", "hover_color": "#d35400", "text_color": "black"}
+        return {"fg_color": "#333", "hover_color": "#444", "text_color": "white"}
 
 # --- BULK CHECK WINDOW ---
 class BulkCheckWindow(ctk.CTkToplevel):
@@ -385,52 +251,69 @@ class BulkCheckWindow(ctk.CTkToplevel):
         self.status_lbl = ctk.CTkLabel(self, text="Ready to start...", text_color="gray")
         self.status_lbl.pack(pady=5)
 
+        self.active = True
+        self.completed = False
+        self.total = 0
+        self.done = 0
+        self.log_buffer = RingLog(self.log_area)
+        self.pool = parent.make_rank_pool()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         self.start_process()
 
     def log(self, text):
-        if not self.winfo_exists():
+        # her thread'den çağrılabilir; satırlar bir sonraki drain'de toplu eklenir
+        self.log_buffer.append(text)
+        self.my_parent.ui.post_latest(("bulk_status", id(self)), self.refresh_status)
+
+    def refresh_status(self):
+        if not self.active or not self.winfo_exists():
             return
-        self.log_area.configure(state="normal")
-        self.log_area.insert("end", text + "\n")
-        self.log_area.see("end")
-        self.log_area.configure(state="disabled")
+        self.log_buffer.flush()
+        if self.completed:
+            self.status_lbl.configure(text="Completed!", text_color="#2ecc71")
+        elif self.total:
+            self.status_lbl.configure(text=f"Checked {self.done}/{self.total}")
+            self.progress.set(self.done / self.total)
+
+    def on_close(self):
+        self.active = False
+        self.pool.stop()
+        self.destroy()
 
     def start_process(self):
         threading.Thread(target=self.run_bulk_check).start()
 
-    def run_bulk_check(self):
-        accounts = self.my_parent.accounts
-        total = len(accounts)
-        self.log(f"Starting check for {total} accounts...")
-
-        for i, acc in enumerate(accounts):
-            if not self.winfo_exists():
-                break
-
+    def apply_batch(self, batch):
+        for acc, scraped_data, error in batch:
+            self.done += 1
             riot_id = acc.get('riot_id', 'Unknown')
-            self.status_lbl.configure(text=f"Checking: {riot_id}")
-            self.log(f"[{i+1}/{total}] Checking {riot_id}...")
-
-            try:
-                scraped_data = self.my_parent.fetch_rank_without_api(acc['server'], riot_id)
-                if scraped_data:
-                    acc.update(scraped_data)
-                    self.log(f"   -> Found: {scraped_data.get('rank_tier')} {scraped_data.get('rank_div')}")
-                else:
-                    self.log("   -> No data or Unranked")
-            except Exception as e:
-                self.log(f"   -> Error: {e}")
-
-            self.progress.set((i + 1) / total)
-            time.sleep(1.2)
+            if scraped_data:
+                acc.update(scraped_data)
+                self.log(f"[{self.done}/{self.total}] {riot_id} -> Found: {scraped_data.get('rank_tier')} {scraped_data.get('rank_div')}")
+            elif error:
+                self.log(f"[{self.done}/{self.total}] {riot_id} -> Error: {error}")
+            else:
+                self.log(f"[{self.done}/{self.total}] {riot_id} -> No data or Unranked")
+        # her batch tek bir transaction, sadece değişen hesaplar yazılır
+        self.my_parent.save_data()
 
+    def finish(self):
         self.my_parent.save_data()
-        self.my_parent.filter_accounts(None)
-        if self.winfo_exists():
-            self.status_lbl.configure(text="Completed!", text_color="#2ecc71")
-            self.log("--- ALL DONE ---")
+        self.completed = True
+        self.log("--- ALL DONE ---")
+        if self.active and self.winfo_exists():
             self.after(3000, self.destroy)
 
+    def run_bulk_check(self):
+        accounts = list(self.my_parent.accounts)
+        self.total = len(accounts)
+        self.done = 0
+        ui = self.my_parent.ui
+        self.log(f"Starting check for {self.total} accounts...")
+        if accounts:
+            self.pool.run(accounts, lambda batch: ui.post(lambda b=batch: self.apply_batch(b)))
+        ui.post(self.finish)
+
 # --- SETTINGS WINDOW ---
 class SettingsWindow(ctk.CTkToplevel):
     def __init__(self, parent):
@@ -500,7 +383,8 @@ class SettingsWindow(ctk.CTkToplevel):
             )
             if filename:
                 with open(filename, 'w') as f:
-                    json.dump(self.my_parent.accounts, f, indent=4)
+                    # şifreler yalnızca ihtiyaç olunca çözülüyor, export için hepsini aç
+                    json.dump([dict(acc, login_pw=acc['login_pw']) for acc in self.my_parent.accounts], f, indent=4)
                 messagebox.showinfo("Success", "Data exported successfully!")
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -512,9 +396,7 @@ class SettingsWindow(ctk.CTkToplevel):
                 with open(filename, 'r') as f:
                     new_data = json.load(f)
                 if isinstance(new_data, list) and len(new_data) > 0 and 'login_id' in new_data[0]:
-                    self.my_parent.accounts = new_data
-                    self.my_parent.save_data()
-                    self.my_parent.filter_accounts(None)
+                    self.my_parent.replace_accounts(new_data)
                     messagebox.showinfo("Success", f"{len(new_data)} accounts imported successfully!")
                 else:
                     messagebox.showerror("Error", "Invalid backup file format.")
@@ -568,7 +450,6 @@ class EditAccountWindow(ctk.CTkToplevel):
         self.acc['riot_id'] = self.entry_riot.get().strip()
         self.acc['note'] = self.entry_note.get("0.0", "end").strip()
         self.my_parent.save_data()
-        self.my_parent.filter_accounts(None)
         self.destroy()
 
 class AddAccountWindow(ctk.CTkToplevel):
@@ -620,7 +501,9 @@ class AddAccountWindow(ctk.CTkToplevel):
             "note": self.entry_note.get("0.0", "end").strip(),
             "last_seen": "Unknown"
         }
-        self.my_parent.add_account_to_db(new_acc)
+        if not self.my_parent.add_account_to_db(new_acc):
+            messagebox.showerror("Error", f"{new_acc['riot_id']} is already saved on {new_acc['server']}.", parent=self)
+            return
         self.destroy()
 
 # --- DETAILS WINDOW ---
@@ -669,9 +552,12 @@ class AccountDetailsWindow(ctk.CTkToplevel):
             text_color="#f1c40f"
         )
         self.lbl_stats.pack(side="left", padx=15, pady=8)
+        self.shown_stats = None
         self.update_stats_ui()
-        # İlk açılışta aktif LCU hesabından çekmeye çalış
-        threading.Thread(target=self.my_parent.fetch_and_save_stats, daemon=True).start()
+        # istatistikler değişince haber gelir, periyodik okumaya gerek yok
+        self.my_parent.account_events.subscribe(self.on_account_event)
+        # İlk açılışta aktif LCU hesabından çekmeye çalış (yakın zamanda çekildiyse tekrar sorma)
+        self.my_parent.refresh_stats()
         # -------------------------------------------
 
         if acc.get('note'):
@@ -748,12 +634,18 @@ class AccountDetailsWindow(ctk.CTkToplevel):
 
     def on_close(self):
         self.active = False
+        self.my_parent.account_events.unsubscribe(self.on_account_event)
         self.destroy()
 
+    def on_account_event(self, kind, acc, keys=None):
+        # fetch_and_save_stats'ın thread'inden gelir
+        if acc is self.acc and kind == "changed" and keys & STATS_FIELDS:
+            self.my_parent.ui.post(self.update_stats_ui)
+
     def refresh_click(self):
         self.lbl_stats.configure(text="Updating...", text_color="gray")
-        self.my_parent.fetch_and_save_stats()
-        self.update_stats_ui()
+        self.shown_stats = None
+        self.my_parent.refresh_stats(force=True, then=self.update_stats_ui)
 
     def update_stats_ui(self):
         if not self.active or not self.winfo_exists():
@@ -767,9 +659,9 @@ class AccountDetailsWindow(ctk.CTkToplevel):
         level_color = "#e67e22" if isinstance(level, int) and level < 30 else "#2ecc71"
 
         text = f"Lvl: {level}   |   Skins: {skins}   |   BE: {be}   |   RP: {rp}"
-        self.lbl_stats.configure(text=text, text_color=level_color)
-
-        self.after(2000, self.update_stats_ui)
+        if text != self.shown_stats:
+            self.lbl_stats.configure(text=text, text_color=level_color)
+            self.shown_stats = text
 
     def create_info_row(self, parent_frame, label_text, value_text):
         row = ctk.CTkFrame(parent_frame, fg_color="transparent")
@@ -841,15 +733,338 @@ class AccountDetailsWindow(ctk.CTkToplevel):
         self.my_parent.delete_account(self.acc)
         self.on_close()
 
+# --- ACCOUNT LIST ---
+class AccountCard(ctk.CTkFrame):
+    """One recycled row of the account list; bind() swaps the account it shows."""
+
+    def __init__(self, master, app):
+        super().__init__(master, border_width=1, border_color="#404040", fg_color="#2b2b2b")
+        self.app = app
+        self.acc = None
+
+        self.content = ctk.CTkFrame(self, fg_color="transparent")
+        self.content.pack(fill="x", padx=15, pady=10)
+
+        self.lbl_img = ctk.CTkLabel(self.content, text="")
+        self.info_frame = ctk.CTkFrame(self.content, fg_color="transparent")
+        self.info_frame.pack(side="left", anchor="w")
+        self.lbl_name = ctk.CTkLabel(
+            self.info_frame,
+            text="",
+            font=("Arial", 18, "bold"),
+            text_color="white"
+        )
+        self.lbl_name.pack(anchor="w")
+        self.lbl_wr = ctk.CTkLabel(self.info_frame, text="", font=("Arial", 11))
+        self.lbl_wr.pack(anchor="w")
+
+        self.lbl_rank = ctk.CTkLabel(self.content, text="", font=("Arial", 14, "bold"))
+        self.lbl_rank.pack(side="right")
+
+        for w in (self, self.content, self.lbl_img, self.info_frame, self.lbl_name, self.lbl_wr, self.lbl_rank):
+            w.bind("<Button-1>", self.on_click)
+
+    def on_click(self, event=None):
+        if self.acc is not None:
+            self.app.open_details_window(self.acc)
+
+    def bind_account(self, acc):
+        self.acc = acc
+        tier = acc.get('rank_tier', 'UNRANKED')
+        rank_img = self.app.rank_icons.get(tier)
+        if rank_img:
+            self.lbl_img.configure(image=rank_img)
+            if not self.lbl_img.winfo_manager():
+                self.lbl_img.pack(side="left", padx=(0, 15), before=self.info_frame)
+        elif self.lbl_img.winfo_manager():
+            self.lbl_img.pack_forget()
+
+        self.lbl_name.configure(text=acc['riot_id'])
+        winrate = acc.get('winrate', '')
+        wr_color = "#2ecc71" if any(x in winrate for x in "56789") else "#e74c3c"
+        self.lbl_wr.configure(text=winrate, text_color=wr_color)
+
+        rank_txt = f"{tier} {acc.get('rank_div', '')}"
+        self.lbl_rank.configure(
+            text=f"{rank_txt} ({acc.get('lp', 0)} LP)",
+            text_color=RANK_COLORS.get(tier, "gray")
+        )
+
+
+class VirtualScrollFrame(ctk.CTkFrame, metaclass=abc.ABCMeta):
+    """Scrollbar and wheel handling for views that only keep widgets for the visible rows; subclasses render()."""
+
+    ROW_HEIGHT = 40  # px; ilk satır ölçülene kadar kullanılan tahmin
+    COLUMNS = 1
+
+    def __init__(self, master, label_text="", **kwargs):
+        super().__init__(master, **kwargs)
+        self.items = []
+        self.first = 0  # ilk görünen satır
+        self.row_height = None  # yerleşmiş bir satırdan ölçülen yükseklik (px), DPI ölçeği dahil
+        self.measure_pending = False
+
+        if label_text:
+            ctk.CTkLabel(self, text=label_text, fg_color=("gray78", "gray23"), corner_radius=6).pack(
+                fill="x", padx=5, pady=(5, 0)
+            )
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(body, command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.viewport = ctk.CTkFrame(body, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+
+        self.viewport.bind("<Configure>", self.on_resize)
+        self.bind_wheel(self.viewport)
+
+    def on_resize(self, event=None):
+        self.schedule_measure()
+        self.render()
+
+    def bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self.on_wheel)
+        widget.bind("<Button-4>", lambda e: self.scroll_to(self.first - 1))
+        widget.bind("<Button-5>", lambda e: self.scroll_to(self.first + 1))
+        for child in widget.winfo_children():
+            self.bind_wheel(child)
+
+    def row_count(self):
+        return -(-len(self.items) // self.COLUMNS)
+
+    def visible_count(self):
+        if self.row_height is None:
+            self.schedule_measure()
+        row_height = self.row_height or self.ROW_HEIGHT
+        return int(max(self.viewport.winfo_height(), row_height) // row_height) + 1
+
+    def schedule_measure(self):
+        if not self.measure_pending:
+            self.measure_pending = True
+            self.after_idle(self.measure_rows)
+
+    @staticmethod
+    def row_span(widget):
+        """Height a laid-out row takes: requested height plus its vertical padding."""
+        info = widget.pack_info() if widget.winfo_manager() == "pack" else widget.grid_info()
+        pady = info.get("pady", 0)
+        parts = [int(float(p)) for p in (pady if isinstance(pady, (tuple, list)) else str(pady).split())]
+        padding = parts[0] * 2 if len(parts) == 1 else sum(parts)
+        return widget.winfo_reqheight() + padding
+
+    def measure_rows(self):
+        # havuz boyutu ve kaydırma sınırı gerçek kart yüksekliğinden hesaplanır
+        self.measure_pending = False
+        heights = [self.row_span(w) for w in self.pool() if w.winfo_manager()]
+        if not heights:
+            return
+        height = max(heights)
+        if height > 1 and height != self.row_height:
+            self.row_height = height
+            self.render()
+
+    def visible_window(self):
+        """(rows that fit, items to show) after clamping first to the current item count."""
+        count = self.visible_count()
+        self.first = min(self.first, max(0, self.row_count() - count + 1))
+        start = self.first * self.COLUMNS
+        return count, self.items[start:start + count * self.COLUMNS]
+
+    def scroll_to(self, first):
+        max_first = max(0, self.row_count() - self.visible_count() + 1)
+        first = min(max(0, int(first)), max_first)
+        if first != self.first:
+            self.first = first
+            self.render()
+
+    def on_wheel(self, event):
+        step = -1 if event.delta > 0 else 1
+        if sys.platform != "darwin" and abs(event.delta) >= 120:
+            step *= abs(event.delta) // 120
+        self.scroll_to(self.first + step)
+
+    def on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(round(float(args[1]) * self.row_count()))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= max(1, self.visible_count() - 1)
+            self.scroll_to(self.first + amount)
+
+    def update_scrollbar(self, count):
+        rows = self.row_count()
+        if rows:
+            self.scrollbar.set(self.first / rows, min(1.0, (self.first + count) / rows))
+        else:
+            self.scrollbar.set(0, 1)
+
+    @abc.abstractmethod
+    def pool(self):
+        """The recycled row widgets."""
+
+    @abc.abstractmethod
+    def render(self, dirty=()):
+        """Binds the pooled widgets to visible_window() and updates the scrollbar."""
+
+
+class VirtualAccountList(VirtualScrollFrame):
+    """Account list that only builds enough cards to fill the view and rebinds them while scrolling."""
+
+    ROW_HEIGHT = 85  # kart + pady, ölçümden önce
+
+    def __init__(self, master, app, label_text=""):
+        self.app = app
+        self.cards = []
+        super().__init__(master, label_text=label_text)
+        self.empty_lbl = ctk.CTkLabel(self.viewport, text="", font=("Arial", 14))
+
+    def pool(self):
+        return self.cards
+
+    def ensure_pool(self, size):
+        while len(self.cards) < size:
+            card = AccountCard(self.viewport, self.app)
+            self.bind_wheel(card)
+            self.cards.append(card)
+
+    def set_items(self, items, empty_text="", dirty=()):
+        self.items = items
+        self.empty_lbl.configure(text=empty_text)
+        self.render(dirty)
+
+    def refresh(self, dirty):
+        """Rebinds only the visible cards whose account (by id()) is in dirty."""
+        for card in self.cards:
+            if card.acc is not None and id(card.acc) in dirty:
+                card.bind_account(card.acc)
+
+    def render(self, dirty=()):
+        count, window = self.visible_window()
+        self.ensure_pool(len(window))
+
+        if not self.items:
+            self.empty_lbl.pack(pady=20)
+        else:
+            self.empty_lbl.pack_forget()
+
+        for i, card in enumerate(self.cards):
+            if i < len(window):
+                # aynı hesap aynı karttaysa ve değişmediyse dokunma
+                if card.acc is not window[i] or id(window[i]) in dirty:
+                    card.bind_account(window[i])
+                if not card.winfo_manager():
+                    card.pack(fill="x", padx=5, pady=8)
+            else:
+                card.acc = None
+                if card.winfo_manager():
+                    card.pack_forget()
+
+        self.update_scrollbar(count)
+
+
+class ChampionGrid(VirtualScrollFrame):
+    """Three-column champion picker backed by a recycled button pool; only visible rows have buttons."""
+
+    ROW_HEIGHT = 38  # buton + pady, ölçümden önce
+    COLUMNS = 3
+
+    def __init__(self, master, style_for, on_select):
+        self.style_for = style_for  # name -> configure() kwargs
+        self.on_select = on_select
+        self.buttons = []
+        self.slot_names = []
+        super().__init__(master, fg_color="transparent")
+        for col in range(self.COLUMNS):
+            self.viewport.grid_columnconfigure(col, weight=1)
+
+    def pool(self):
+        return self.buttons
+
+    def ensure_pool(self, size):
+        while len(self.buttons) < size:
+            slot = len(self.buttons)
+            btn = ctk.CTkButton(self.viewport, text="", height=32, command=lambda i=slot: self.on_click(i))
+            self.bind_wheel(btn)
+            self.buttons.append(btn)
+            self.slot_names.append(None)
+
+    def on_click(self, slot):
+        name = self.slot_names[slot]
+        if name is not None:
+            self.on_select(name)
+
+    def set_items(self, names):
+        self.items = names
+        self.first = 0
+        self.render()
+
+    def restyle(self, names):
+        """Reconfigures only the visible buttons showing one of names."""
+        for slot, name in enumerate(self.slot_names):
+            if name is not None and name in names:
+                self.buttons[slot].configure(**self.style_for(name))
+
+    def render(self, dirty=()):
+        count, window = self.visible_window()
+        self.ensure_pool(len(window))
+        for slot, btn in enumerate(self.buttons):
+            if slot < len(window):
+                name = window[slot]
+                if self.slot_names[slot] != name or name in dirty:
+                    btn.configure(text=name, **self.style_for(name))
+                    self.slot_names[slot] = name
+                if not btn.winfo_manager():
+                    btn.grid(row=slot // self.COLUMNS, column=slot % self.COLUMNS, padx=3, pady=3, sticky="ew")
+            else:
+                self.slot_names[slot] = None
+                if btn.winfo_manager():
+                    btn.grid_remove()
+        self.update_scrollbar(count)
+
+# --- ICONS ---
+class IconSet:
+    """name -> CTkImage, built on first use from one down-sampled image shared by light and dark mode."""
+
+    def __init__(self, specs, scale=1.0):
+        self.specs = specs  # name -> (asset path parts, display size)
+        self.scale = max(scale, 1.0)
+        self.images = {}
+
+    def get(self, name, default=None):
+        if name not in self.images:
+            spec = self.specs.get(name)
+            image = None
+            if spec:
+                parts, size = spec
+                path = asset_path(*parts)
+                if path:
+                    try:
+                        pil_image = image_cache.get(path, ImageCache.pixel_size(size, self.scale))
+                        image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=size)
+                    except OSError as e:
+                        print("ICON ERROR:", path, e)
+            self.images[name] = image
+        image = self.images[name]
+        return default if image is None else image
+
+    def __getitem__(self, name):
+        return self.get(name)
+
+
 # --- MAIN APP ---
 class LolManagerApp(ctk.CTk):
     def __init__(self):
         super().__init__()
         self.title("League ACC Manager v13.0 (Level Up)")
         self.geometry("1000x700")
+        # worker thread'lerden Tk thread'ine tek kapı
+        self.ui = UIDispatcher(self)
+        self.ui.start()
 
         self.api_key = ""  # API Key kullanılmıyor
         self.riot_client_path = ""
+        self.lol_install_dir = ""
         self.auto_accept_var = ctk.BooleanVar(value=False)
         self.auto_pick_var = ctk.BooleanVar(value=False)
         self.auto_ban_var = ctk.BooleanVar(value=False)
@@ -857,8 +1072,17 @@ class LolManagerApp(ctk.CTk):
         self.target_champ_name = "None"
         self.target_ban_id = 0
         self.target_ban_name = "None"
-
-        self.last_stats_update = 0
+        self.scrape_workers = SCRAPE_WORKERS
+        self.scrape_rate = SCRAPE_RATE
+        self.scrape_burst = SCRAPE_BURST
+
+        self.last_stats_update = 0  # son başarılı (eşleşmiş ve kaydedilmiş) istatistik
+        self.last_stats_attempt = 0  # arka plan döngüsünün son denemesi
+        self.stats_interval = 60
+        self.stats_matched = False
+        self.stats_lock = threading.Lock()
+        self.poll_scheduler = PollScheduler()
+        self.riot_readiness = None
 
         # --- PENCERE TAKİBİ ---
         self.w_settings = None
@@ -875,6 +1099,15 @@ class LolManagerApp(ctk.CTk):
         self.protocol("WM_DELETE_WINDOW", self.force_exit)
 
         self.accounts = self.load_data()
+        self.search_index = AccountSearchIndex()
+        self.search_index.rebuild(self.accounts)
+        self.search_after_id = None
+        # değişen hesaplar bir sonraki Tk turunda tek seferde çizilir
+        self.dirty_accounts = {}
+        self.reorder_pending = False
+        self.account_flush_pending = False
+        self.account_lock = threading.Lock()
+        self.account_events.subscribe(self.on_account_event)
         self.sort_descending = True
 
         self.load_icons()
@@ -901,7 +1134,7 @@ class LolManagerApp(ctk.CTk):
         self.server_menu.pack(padx=20, pady=5)
 
         self.search_var = ctk.StringVar()
-        self.search_var.trace("w", self.filter_accounts)
+        self.search_var.trace("w", self.schedule_filter)
         self.entry_search = ctk.CTkEntry(
             self.sidebar,
             placeholder_text="🔍 Search (Name, Rank, Note)",
@@ -988,12 +1221,18 @@ class LolManagerApp(ctk.CTk):
         )
         self.exit_btn.pack(side="bottom", pady=(0, 10))
 
-        self.main_area = ctk.CTkScrollableFrame(self, label_text="Accounts List")
+        self.main_area = VirtualAccountList(self, self, label_text="Accounts List")
         self.main_area.pack(side="right", fill="both", expand=True, padx=15, pady=15)
 
         self.filter_accounts(None)
 
         self.running = True
+        threading.Thread(target=self.check_champion_updates, daemon=True).start()
+        self.champ_select = ChampSelectState(lcu_handler)
+        for var in (self.auto_accept_var, self.auto_pick_var, self.auto_ban_var):
+            var.trace_add("write", lambda *args: self.poll_scheduler.wake())
+        self.start_lockfile_watcher()
+        self.start_lcu_events()
         threading.Thread(target=self.background_loop, daemon=True).start()
 
     def load_settings(self):
@@ -1003,6 +1242,7 @@ class LolManagerApp(ctk.CTk):
                     data = json.load(f)
                     self.api_key = data.get("api_key", "")
                     self.riot_client_path = data.get("riot_path", "")
+                    self.lol_install_dir = data.get("lol_install_dir", "")
                     self.auto_accept_var.set(data.get("auto_accept", False))
                     self.auto_pick_var.set(data.get("auto_pick", False))
                     self.auto_ban_var.set(data.get("auto_ban", False))
@@ -1010,6 +1250,11 @@ class LolManagerApp(ctk.CTk):
                     self.target_champ_name = data.get("pick_champ_name", "None")
                     self.target_ban_id = data.get("ban_champ_id", 0)
                     self.target_ban_name = data.get("ban_champ_name", "None")
+                    lcu_handler.configure_timeouts(data.get("lcu_timeouts", {}))
+                    self.scrape_workers = data.get("scrape_workers", SCRAPE_WORKERS)
+                    self.scrape_rate = data.get("scrape_rate", SCRAPE_RATE)
+                    self.scrape_burst = data.get("scrape_burst", SCRAPE_BURST)
+                    rank_cache.ttl = data.get("rank_cache_ttl", RANK_CACHE_TTL)
             except:
                 pass
 
@@ -1017,34 +1262,51 @@ class LolManagerApp(ctk.CTk):
         data = {
             "api_key": self.api_key,
             "riot_path": self.riot_client_path,
+            "lol_install_dir": self.lol_install_dir,
             "auto_accept": self.auto_accept_var.get(),
             "auto_pick": self.auto_pick_var.get(),
             "auto_ban": self.auto_ban_var.get(),
             "pick_champ_id": self.target_champ_id,
             "pick_champ_name": self.target_champ_name,
             "ban_champ_id": self.target_ban_id,
-            "ban_champ_name": self.target_ban_name
+            "ban_champ_name": self.target_ban_name,
+            "lcu_timeouts": {k: list(v) for k, v in lcu_handler.timeouts.items()},
+            "scrape_workers": self.scrape_workers,
+            "scrape_rate": self.scrape_rate,
+            "scrape_burst": self.scrape_burst,
+            "rank_cache_ttl": rank_cache.ttl
         }
         with open(CONFIG_FILE, "w") as f:
             json.dump(data, f, indent=4)
 
     def force_exit(self):
         self.running = False
+        self.ui.stop()
+        if self.riot_readiness:
+            self.riot_readiness.cancel()
+        self.poll_scheduler.wake()
+        self.lockfile_watcher.stop()
+        self.lcu_events.stop()
         self.destroy()
         sys.exit()
 
     def get_champions(self):
+        # diskteki patch anında yüklenir, DDragon kontrolü arka planda yapılır
+        return load_cached_champions() or dict(FALLBACK_CHAMPIONS)
+
+    def check_champion_updates(self):
         try:
-            ver = requests.get("https://ddragon.leagueoflegends.com/api/versions.json").json()[0]
-            data = requests.get(
-                f"https://ddragon.leagueoflegends.com/cdn/{ver}/data/en_US/champion.json"
-            ).json()
-            champs = {}
-            for k, v in data['data'].items():
-                champs[v['name']] = int(v['key'])
-            return champs
-        except:
-            return {"Yasuo": 157, "Yone": 777}
+            champs = refresh_champions()
+        except Exception as e:
+            print("DDRAGON REFRESH ERROR:", e)
+            return
+        if champs and champs != self.champions_map:
+            self.ui.post(lambda: self.on_champions_updated(champs))
+
+    def on_champions_updated(self, champs):
+        self.champions_map = champs
+        if self.w_gametools is not None and self.w_gametools.winfo_exists():
+            self.w_gametools.refresh_champ_buttons()
 
     def open_game_tools(self):
         if self.w_gametools is None or not self.w_gametools.winfo_exists():
@@ -1078,32 +1340,49 @@ class LolManagerApp(ctk.CTk):
 
     def open_log_profile(self, acc):
         """League of Graphs profiline doğrudan git"""
-        riot_id = acc.get("riot_id", "")
-        if "#" not in riot_id:
-            return
+        url = build_profile_url(acc.get("server", "TR1"), acc.get("riot_id", ""))
+        if url:
+            webbrowser.open(url)
 
-        name, tag = riot_id.split("#", 1)
+    def refresh_stats(self, force=False, then=None):
+        """fetch_and_save_stats on a worker thread, unless a matched result is younger than STATS_FRESHNESS."""
+        if not force and self.stats_matched and time.time() - self.last_stats_update < STATS_FRESHNESS:
+            return False
+
+        def work():
+            self.fetch_and_save_stats()
+            if then:
+                self.ui.post(then)
 
-        region_map = {"TR1": "tr", "EUW1": "euw", "EUN1": "eune", "NA1": "na"}
-        region = region_map.get(acc.get("server", "TR1"), "tr")
+        threading.Thread(target=work, daemon=True).start()
+        return True
 
-        # "Name-Tag" yapıp URL encode et
-        slug = urllib.parse.quote(f"{name}-{tag}", safe="")
-        url = f"https://www.leagueofgraphs.com/summoner/{region}/{slug}"
-        webbrowser.open(url)
     def fetch_and_save_stats(self):
+        # arka plan döngüsü ve detay penceresi aynı anda LCU'ya gitmesin
+        if not self.stats_lock.acquire(blocking=False):
+            self.stats_matched = False
+            return
+        # sadece kaydedilen bir sonuç "taze" sayılır; erken dönüşlerde False kalır
+        self.stats_matched = False
         try:
-            # Lockfile değişmiş olabilir; birkaç kez yeniden dene
-            r = None
-            for _ in range(5):
-                lcu_handler.try_connect()
-                if not lcu_handler.connected:
-                    time.sleep(1)
-                    continue
-                r = lcu_handler.request("GET", "/lol-summoner/v1/current-summoner")
-                if r and r.status_code == 200:
-                    break
-                time.sleep(1)
+            # Birbirinden bağımsız çağrılar aynı anda gider (tek tur + ortak deadline)
+            stats_jobs = {
+                "summoner": lambda: lcu_handler.request("GET", "/lol-summoner/v1/current-summoner"),
+                "store_wallet": lambda: lcu_handler.request("GET", "/lol-store/v1/wallet"),
+                "be_wallet": lambda: lcu_handler.request(
+                    "GET", '/lol-inventory/v1/wallet?currencyTypes=["BE","BLUE_ESSENCE"]'
+                ),
+                "rp_wallet": lambda: lcu_handler.request("GET", '/lol-inventory/v1/wallet?currencyTypes=["RP"]'),
+                "skin_count": lambda: lcu_handler.count_items(
+                    '/lol-inventory/v1/inventory?inventoryTypes=["CHAMPION_SKIN"]'
+                ),
+            }
+
+            # bağlantıyı lockfile watcher yönetir; burada tekrar denemeye gerek yok
+            if not lcu_handler.connected:
+                return
+            results = lcu_handler.gather(stats_jobs)
+            r = results["summoner"]
 
             if not r or r.status_code != 200:
                 print("STATS current-summoner failed", r.status_code if r else "no response")
@@ -1114,12 +1393,7 @@ class LolManagerApp(ctk.CTk):
             current_level = data.get('summonerLevel', 0)
 
             # 2) DB'de bu hesabı bul
-            current_clean = normalize_id(current_riot_id)
-            target_acc = None
-            for acc in self.accounts:
-                if normalize_id(acc['riot_id']) == current_clean:
-                    target_acc = acc
-                    break
+            target_acc = self.search_index.find_by_riot_id(current_riot_id)
 
             # Eğer eşleşme yoksa, aktif detay penceresindeki hesabı bu Riot ID ile eşleştir
             if not target_acc and self.w_details and self.w_details.winfo_exists():
@@ -1150,7 +1424,7 @@ class LolManagerApp(ctk.CTk):
             rp = 0
 
             # 3) BLUE ESSENCE -> /lol-store/v1/wallet
-            store_wallet = lcu_handler.request("GET", "/lol-store/v1/wallet")
+            store_wallet = results["store_wallet"]
             if store_wallet and store_wallet.status_code == 200:
                 w = store_wallet.json()
 
@@ -1181,10 +1455,7 @@ class LolManagerApp(ctk.CTk):
             # 3-b) BLUE ESSENCE fallback -> /lol-inventory/v1/wallet?currencyTypes=["BLUE_ESSENCE"]
             # Bazı istemciler BE'yi store wallet'ta döndürmüyor, bu yüzden inventory üzerinden de deniyoruz.
             if be == 0:
-                be_wallet = lcu_handler.request(
-                    "GET",
-                    '/lol-inventory/v1/wallet?currencyTypes=["BE","BLUE_ESSENCE"]'
-                )
+                be_wallet = results["be_wallet"]
                 if be_wallet and be_wallet.status_code == 200:
                     be_data = be_wallet.json()
                     be_val = None
@@ -1217,8 +1488,8 @@ class LolManagerApp(ctk.CTk):
 
             # 4) RIOT POINTS -> /lol-inventory/v1/wallet?currencyTypes=["RP"]
             rp_wallet = None
-            if rp == 0:  # only ask inventory if store wallet didn't give RP
-                rp_wallet = lcu_handler.request("GET", '/lol-inventory/v1/wallet?currencyTypes=["RP"]')
+            if rp == 0:  # only use inventory if store wallet didn't give RP
+                rp_wallet = results["rp_wallet"]
                 if rp_wallet and rp_wallet.status_code == 200:
                     rp_data = rp_wallet.json()
                     rp_val = None
@@ -1260,16 +1531,14 @@ class LolManagerApp(ctk.CTk):
             target_acc['blue_essence'] = be
             target_acc['rp'] = rp
 
-            # 5) Skin sayısı
-            skin_r = lcu_handler.request(
-                "GET",
-                '/lol-inventory/v1/inventory?inventoryTypes=["CHAMPION_SKIN"]'
-            )
-            if skin_r and skin_r.status_code == 200:
-                skins = skin_r.json()
-                target_acc['skin_count'] = len(skins) if isinstance(skins, list) else 0
+            # 5) Skin sayısı (liste bellekte tutulmadan, akış sırasında sayıldı)
+            skin_count = results["skin_count"]
+            if skin_count is not None:
+                target_acc['skin_count'] = skin_count
 
             self.save_data()
+            self.last_stats_update = time.time()
+            self.stats_matched = True
             # print(
             #     f"Stats Saved: {current_riot_id} -> "
             #     f"Lvl {current_level}, Skins {target_acc.get('skin_count', 0)}, BE {be}, RP {rp}"
@@ -1278,98 +1547,125 @@ class LolManagerApp(ctk.CTk):
         except Exception as e:
             # print("Stats Error:", e)
             pass
-        
+        finally:
+            self.stats_lock.release()
+
+    def handle_gameflow_phase(self, phase, *args):
+        self.poll_scheduler.set_phase(phase)
+        if phase != "ChampSelect":
+            self.champ_select.reset()
+
+    def handle_ready_check(self, data, *args):
+        # websocket yolu; polling yolunda kabulü poll_gameflow yapar
+        if not self.auto_accept_var.get() or not self.lcu_events.connected or not isinstance(data, dict):
+            return
+        if data.get("state") == "InProgress" and data.get("playerResponse") == "None":
+            lcu_handler.request("POST", "/lol-matchmaking/v1/ready-check/accept")
+
+    def handle_champ_select(self, session, event_type=None):
+        if event_type == "Delete":
+            self.champ_select.reset()
+            return
+        if not isinstance(session, dict):
+            return
+        self.champ_select.update(session)
+        targets = []
+        if self.auto_ban_var.get() and self.target_ban_id != 0:
+            targets.append(("ban", self.target_ban_id))
+        if self.auto_pick_var.get() and self.target_champ_id != 0:
+            targets.append(("pick", self.target_champ_id))
+        for action_type, champ_id in targets:
+            for action in self.champ_select.take_new(action_type, champ_id):
+                action_data = {
+                    "championId": champ_id,
+                    "completed": True
+                }
+                r = lcu_handler.request(
+                    "PATCH",
+                    f"/lol-champ-select/v1/session/actions/{action['id']}",
+                    action_data
+                )
+                if r is None or r.status_code >= 400:
+                    self.champ_select.release(action['id'])
+
+    def start_lockfile_watcher(self):
+        lcu_handler.subscribe(self.on_lcu_connection)
+        self.lockfile_watcher = lcu_handler.watch(self.lol_install_dir, self.on_install_dir_found)
+
+    def on_install_dir_found(self, path):
+        # kurulum klasörü bir kez bulunur, sonraki açılışlarda config'den gelir
+        if path != self.lol_install_dir:
+            self.lol_install_dir = path
+            self.ui.post(self.save_config)
+
+    def on_lcu_connection(self, connected):
+        if connected:
+            # istemci yeni açıldı, istatistikleri hemen yenile
+            self.last_stats_update = 0
+            self.last_stats_attempt = 0
+        else:
+            self.champ_select.reset()
+        self.poll_scheduler.wake()
+
+    def start_lcu_events(self):
+        self.lcu_events = LCUEventClient(lcu_handler)
+        self.lcu_events.on(GAMEFLOW_PHASE_URI, self.handle_gameflow_phase)
+        self.lcu_events.on(READY_CHECK_URI, self.handle_ready_check)
+        self.lcu_events.on(CHAMP_SELECT_URI, self.handle_champ_select)
+        self.lcu_events.start()
+
+    def poll_gameflow(self):
+        # websocket yokken (veya koptuğunda) eski polling yolu
+        r = lcu_handler.request("GET", GAMEFLOW_PHASE_URI)
+        if not r or r.status_code != 200:
+            return
+        phase = r.json()
+        self.handle_gameflow_phase(phase)
+        if self.auto_accept_var.get() and phase == "ReadyCheck":
+            lcu_handler.request("POST", "/lol-matchmaking/v1/ready-check/accept")
+        if phase == "ChampSelect" and (self.auto_ban_var.get() or self.auto_pick_var.get()):
+            session = self.champ_select.fetch()
+            if session:
+                self.handle_champ_select(session)
+
     def background_loop(self):
         while self.running:
             if not lcu_handler.connected:
-                lcu_handler.try_connect()
+                lcu_handler.revive()
 
+            stats_due_in = None
             if lcu_handler.connected:
-                if time.time() - self.last_stats_update > 60:
+                if time.time() - self.last_stats_attempt > self.stats_interval:
+                    self.last_stats_attempt = time.time()
                     self.fetch_and_save_stats()
-                    self.last_stats_update = time.time()
+                stats_due_in = self.last_stats_attempt + self.stats_interval - time.time()
 
                 try:
-                    if self.auto_accept_var.get() or self.auto_pick_var.get() or self.auto_ban_var.get():
-                        r = lcu_handler.request("GET", "/lol-gameflow/v1/gameflow-phase")
-                        if r and r.status_code == 200:
-                            phase = r.json()
-                            if self.auto_accept_var.get() and phase == "ReadyCheck":
-                                lcu_handler.request("POST", "/lol-matchmaking/v1/ready-check/accept")
-                            if phase == "ChampSelect":
-                                if self.auto_ban_var.get() and self.target_ban_id != 0:
-                                    s = lcu_handler.request("GET", "/lol-champ-select/v1/session")
-                                    if s and s.status_code == 200:
-                                        session = s.json()
-                                        local_cell_id = session.get('localPlayerCellId')
-                                        for actions in session.get('actions', []):
-                                            for action in actions:
-                                                if (
-                                                    action['actorCellId'] == local_cell_id
-                                                    and action['type'] == 'ban'
-                                                    and not action['completed']
-                                                ):
-                                                    ban_data = {
-                                                        "championId": self.target_ban_id,
-                                                        "completed": True
-                                                    }
-                                                    lcu_handler.request(
-                                                        "PATCH",
-                                                        f"/lol-champ-select/v1/session/actions/{action['id']}",
-                                                        ban_data
-                                                    )
-                                if self.auto_pick_var.get() and self.target_champ_id != 0:
-                                    s = lcu_handler.request("GET", "/lol-champ-select/v1/session")
-                                    if s and s.status_code == 200:
-                                        session = s.json()
-                                        local_cell_id = session.get('localPlayerCellId')
-                                        for actions in session.get('actions', []):
-                                            for action in actions:
-                                                if (
-                                                    action['actorCellId'] == local_cell_id
-                                                    and action['type'] == 'pick'
-                                                    and not action['completed']
-                                                ):
-                                                    pick_data = {
-                                                        "championId": self.target_champ_id,
-                                                        "completed": True
-                                                    }
-                                                    lcu_handler.request(
-                                                        "PATCH",
-                                                        f"/lol-champ-select/v1/session/actions/{action['id']}",
-                                                        pick_data
-                                                    )
+                    # websocket bağlıyken olaylar zaten geliyor, polling gerekmez
+                    if not self.lcu_events.connected and self.auto_features_on():
+                        self.poll_gameflow()
                 except:
-                    lcu_handler.connected = False
-            time.sleep(1.5)
+                    lcu_handler.set_connected(False)
 
-    def load_icons(self):
-        self.icons = {}
-        assets_dir = resource_path("assets")
-
-        def get_img(filename, size):
-            path = os.path.join(assets_dir, filename)
-            if not os.path.exists(path):
-                path = os.path.join(os.path.abspath("."), "assets", filename)
-            if os.path.exists(path):
-                return ctk.CTkImage(
-                    light_image=Image.open(path),
-                    dark_image=Image.open(path),
-                    size=size
-                )
-            return None
+            interval = self.poll_scheduler.next_interval(lcu_handler.connected, self.auto_features_on(), stats_due_in)
+            self.poll_scheduler.sleep(interval)
+
+    def auto_features_on(self):
+        return self.auto_accept_var.get() or self.auto_pick_var.get() or self.auto_ban_var.get()
 
+    def load_icons(self):
         s = (14, 14)
-        self.icons['edit'] = get_img("edit.png", s)
-        self.icons['delete'] = get_img("delete.png", s)
-        self.icons['copy'] = get_img("copy.png", s)
-        self.icons['show'] = get_img("show.png", s)
-        self.icons['hide'] = get_img("hide.png", s)
-        self.icons['save'] = get_img("save.png", (24, 24))
+        self.icons = IconSet({
+            'edit': (("edit.png",), s),
+            'delete': (("delete.png",), s),
+            'copy': (("copy.png",), s),
+            'show': (("show.png",), s),
+            'hide': (("hide.png",), s),
+            'save': (("save.png",), (24, 24)),
+        }, self._get_window_scaling())
 
     def load_rank_images(self):
-        self.rank_icons = {}
-        rank_dir = resource_path(os.path.join("assets", "ranks"))
+        # rütbe ikonları ilk kart çizilirken tek tek yüklenir
         size = (45, 45)
         tiers = [
             "IRON",
@@ -1384,62 +1680,74 @@ class LolManagerApp(ctk.CTk):
             "CHALLENGER",
             "UNRANKED"
         ]
-        for tier in tiers:
-            path = os.path.join(rank_dir, f"{tier}.png")
-            if not os.path.exists(path):
-                path = os.path.join(os.path.abspath("."), "assets", "ranks", f"{tier}.png")
-            if os.path.exists(path):
-                self.rank_icons[tier] = ctk.CTkImage(
-                    light_image=Image.open(path),
-                    dark_image=Image.open(path),
-                    size=size
-                )
-            else:
-                self.rank_icons[tier] = None
-
-    def apply_account_defaults(self, acc):
-        # missing stat fields to safe defaults so UI doesn't get None/N/A
-        acc.setdefault("level", 0)
-        acc.setdefault("blue_essence", 0)
-        acc.setdefault("rp", 0)
-        acc.setdefault("skin_count", 0)
-        acc.setdefault("rank_tier", "UNRANKED")
-        acc.setdefault("rank_div", "")
-        acc.setdefault("lp", 0)
-        acc.setdefault("last_seen", "Unknown")
-        acc.setdefault("winrate", "")
-        return acc
+        self.rank_icons = IconSet(
+            {tier: (("ranks", f"{tier}.png"), size) for tier in tiers},
+            self._get_window_scaling()
+        )
 
     def load_data(self):
-        if not os.path.exists(DATA_FILE):
-            return []
-        with open(DATA_FILE, "r") as f:
-            data = json.load(f)
-            for acc in data:
-                acc['login_pw'] = cipher_man.decrypt(acc['login_pw'])
-                self.apply_account_defaults(acc)
-            return data
+        self.account_events = AccountEvents()
+        self.store = AccountStore(cipher_man, events=self.account_events)
+        accounts = self.store.load()
+        for acc in accounts:
+            apply_account_defaults(acc)
+        return accounts
 
     def save_data(self):
-        data_to_save = []
-        for acc in self.accounts:
-            safe_acc = acc.copy()
-            safe_acc['login_pw'] = cipher_man.encrypt(acc['login_pw'])
-            data_to_save.append(safe_acc)
-        with open(DATA_FILE, "w") as f:
-            json.dump(data_to_save, f, indent=4)
+        self.store.save(self.accounts)
 
     def add_account_to_db(self, new_acc):
-        self.apply_account_defaults(new_acc)
+        if self.search_index.find_by_riot_id(new_acc['riot_id'], new_acc['server']):
+            return False
+        new_acc = self.store.adopt(apply_account_defaults(new_acc))
         self.accounts.append(new_acc)
+        self.account_events.emit("added", new_acc)
         self.save_data()
-        self.filter_accounts(None)
+        return True
 
     def delete_account(self, acc):
         if acc in self.accounts:
             self.accounts.remove(acc)
+        self.account_events.emit("removed", acc)
         self.save_data()
-        self.filter_accounts(None)
+
+    def replace_accounts(self, data):
+        self.accounts = [self.store.adopt(apply_account_defaults(acc)) for acc in data]
+        self.account_events.emit("reset")
+        self.save_data()
+
+    def on_account_event(self, kind, acc, keys=None):
+        # herhangi bir thread'den gelebilir; index'in kendi lock'u var, çizim Tk thread'ine bırakılır
+        if kind == "changed" and not keys & (INDEXED_FIELDS | CARD_FIELDS):
+            return
+        if kind == "removed":
+            self.search_index.remove(acc)
+        elif kind == "reset":
+            self.search_index.rebuild(self.accounts)
+        elif kind == "added" or keys & INDEXED_FIELDS:
+            self.search_index.update(acc)
+        with self.account_lock:
+            if acc is not None:
+                self.dirty_accounts[id(acc)] = acc
+            if kind != "changed" or keys & INDEXED_FIELDS:
+                self.reorder_pending = True
+            if self.account_flush_pending:
+                return
+            self.account_flush_pending = True
+        self.ui.post(self.flush_account_changes)
+
+    def flush_account_changes(self):
+        with self.account_lock:
+            dirty = set(self.dirty_accounts)
+            reorder = self.reorder_pending
+            self.dirty_accounts = {}
+            self.reorder_pending = False
+            self.account_flush_pending = False
+        if reorder:
+            # sıralama/filtre değişmiş olabilir; yalnızca yeri veya içeriği değişen kartlar yeniden bağlanır
+            self.filter_accounts(None, dirty=dirty)
+        else:
+            self.main_area.refresh(dirty)
 
     def copy_to_clipboard(self, text, btn):
         self.clipboard_clear()
@@ -1450,10 +1758,7 @@ class LolManagerApp(ctk.CTk):
         self.after(1000, lambda: btn.configure(fg_color=orig_fg))
 
     def get_rank_score(self, acc):
-        tier = acc.get("rank_tier", "UNRANKED")
-        base = RANK_ORDER.get(tier, -1)
-        div = {"I": 300, "II": 200, "III": 100, "IV": 0}.get(acc.get("rank_div", "IV"), 0)
-        return base + div + acc.get("lp", 0)
+        return rank_score(acc)
 
     def toggle_sort(self):
         self.sort_descending = not self.sort_descending
@@ -1462,72 +1767,17 @@ class LolManagerApp(ctk.CTk):
         )
         self.filter_accounts(None)
 
-    def filter_accounts(self, *args):
-        for w in self.main_area.winfo_children():
-            w.destroy()
-        selected = self.server_var.get()
-        search_query = self.search_var.get().lower()
-
-        filtered = []
-        for acc in self.accounts:
-            if acc["server"] != selected:
-                continue
-            search_text = f"{acc['riot_id']} {acc.get('rank_tier','')} {acc.get('note','')} {acc['login_id']}".lower()
-            if search_query and search_query not in search_text:
-                continue
-            filtered.append(acc)
-
-        filtered.sort(key=self.get_rank_score, reverse=self.sort_descending)
-        if not filtered:
-            ctk.CTkLabel(
-                self.main_area,
-                text=f"No accounts in {selected}",
-                font=("Arial", 14)
-            ).pack(pady=20)
-        for acc in filtered:
-            self.create_card(acc)
-
-    def create_card(self, acc):
-        card = ctk.CTkFrame(self.main_area, border_width=1, border_color="#404040", fg_color="#2b2b2b")
-        card.pack(fill="x", padx=5, pady=8)
-        card.bind("<Button-1>", lambda event, a=acc: self.open_details_window(a))
-        content = ctk.CTkFrame(card, fg_color="transparent")
-        content.pack(fill="x", padx=15, pady=10)
-        content.bind("<Button-1>", lambda event, a=acc: self.open_details_window(a))
-
-        rank_img = self.rank_icons.get(acc.get('rank_tier', 'UNRANKED'))
-        if rank_img:
-            lbl_img = ctk.CTkLabel(content, text="", image=rank_img)
-            lbl_img.pack(side="left", padx=(0, 15))
-            lbl_img.bind("<Button-1>", lambda event, a=acc: self.open_details_window(a))
+    def schedule_filter(self, *args):
+        # her tuşta değil, yazma durunca filtrele
+        if self.search_after_id is not None:
+            self.after_cancel(self.search_after_id)
+        self.search_after_id = self.after(SEARCH_DEBOUNCE_MS, self.filter_accounts)
 
-        info_frame = ctk.CTkFrame(content, fg_color="transparent")
-        info_frame.pack(side="left", anchor="w")
-        info_frame.bind("<Button-1>", lambda event, a=acc: self.open_details_window(a))
-        ctk.CTkLabel(
-            info_frame,
-            text=acc['riot_id'],
-            font=("Arial", 18, "bold"),
-            text_color="white"
-        ).pack(anchor="w")
-        if 'winrate' in acc:
-            wr_color = "#2ecc71" if any(x in acc['winrate'] for x in "56789") else "#e74c3c"
-            ctk.CTkLabel(
-                info_frame,
-                text=acc['winrate'],
-                font=("Arial", 11),
-                text_color=wr_color
-            ).pack(anchor="w")
-
-        rank_txt = f"{acc.get('rank_tier', 'UNRANKED')} {acc.get('rank_div', '')}"
-        lbl_rank = ctk.CTkLabel(
-            content,
-            text=f"{rank_txt} ({acc.get('lp', 0)} LP)",
-            font=("Arial", 14, "bold"),
-            text_color=RANK_COLORS.get(acc.get('rank_tier', 'UNRANKED'), "gray")
-        )
-        lbl_rank.pack(side="right")
-        lbl_rank.bind("<Button-1>", lambda event, a=acc: self.open_details_window(a))
+    def filter_accounts(self, *args, dirty=()):
+        self.search_after_id = None
+        selected = self.server_var.get()
+        filtered = self.search_index.query(selected, self.search_var.get(), self.sort_descending)
+        self.main_area.set_items(filtered, f"No accounts in {selected}", dirty)
 
     def calculate_time_ago(self, ms):
         if not ms:
@@ -1591,93 +1841,102 @@ class LolManagerApp(ctk.CTk):
                     [riot_path, "--launch-product=league_of_legends", "--launch-patchline=live"],
                     creationflags=subprocess.DETACHED_PROCESS
                 )
-            time.sleep(10)
-            # Kullanıcı adını paste ederek yaz (i/ı problemi için klavye layout'tan bağımsız)
-            self.clipboard_clear()
-            self.clipboard_append(acc['login_id'])
-            self.update()
-            pyautogui.hotkey('command' if sys.platform == 'darwin' else 'ctrl', 'a')
-            pyautogui.press('backspace')
-            pyautogui.hotkey('command' if sys.platform == 'darwin' else 'ctrl', 'v')
-            time.sleep(0.5)
-            pyautogui.press('tab')
-            time.sleep(0.5)
-            self.clipboard_clear()
-            self.clipboard_append(acc['login_pw'])
-            self.update()
-            if sys.platform == 'darwin':
-                pyautogui.hotkey('command', 'v')
-            else:
-                pyautogui.hotkey('ctrl', 'v')
-            time.sleep(0.5)
-            pyautogui.press('enter')
+            # sabit 10 sn yerine Riot Client'ın giriş ekranı hazır olunca yaz
+            threading.Thread(target=self.wait_for_login_form, args=(acc,), daemon=True).start()
         except:
             pass
 
-    def fetch_rank_without_api(self, server, riot_id):
-        """League of Graphs üzerinden rank çekme"""
-        try:
-            if "#" not in riot_id:
-                return None
-
-            name, tag = riot_id.split("#", 1)
-
-            region_map = {"TR1": "tr", "EUW1": "euw", "EUN1": "eune", "NA1": "na"}
-            region = region_map.get(server, "tr")
-
-            slug = urllib.parse.quote(f"{name}-{tag}", safe="")
-            url = f"https://www.leagueofgraphs.com/summoner/{region}/{slug}"
-
-            ua = UserAgent()
-            headers = {"User-Agent": ua.random}
-            response = requests.get(url, headers=headers, timeout=5)
-            if response.status_code != 200:
-                print("LoG SCRAPE ERROR:", response.status_code, url)
-                return None
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            tier_elem = soup.find(class_="leagueTier")
-            if tier_elem:
-                full_rank = tier_elem.text.strip().upper()
-                parts = full_rank.split()
-                tier = parts[0]
-                div = parts[1] if len(parts) > 1 else ""
-                lp = 0
-
-                lp_elem = soup.find(class_="league-points")
-                if lp_elem:
-                    lp = int(re.sub(r'[^0-9]', '', lp_elem.text.strip()) or 0)
-
-                wr_elem = soup.find(class_="pie-chart-wrapper")
-                wr_text = ""
-                if wr_elem and wr_elem.get("data-percentage"):
-                    wr_text = f"%{wr_elem.get('data-percentage')} Win Rate"
+    def wait_for_login_form(self, acc):
+        self.riot_readiness = RiotClientReadiness()
+        state = self.riot_readiness.wait()
+        if state == LOGIN_READY:
+            self.ui.post(lambda: self.type_credentials(acc))
+        elif state == LOGGED_IN:
+            print("AUTO LOGIN: Riot Client already has a session, skipping")
+        elif self.running:
+            print("AUTO LOGIN: Riot Client was not ready in time")
+
+    def type_credentials(self, acc):
+        """Pastes login id and password into the login form; steps are chained with after() so Tk keeps drawing."""
+        mod = 'command' if sys.platform == 'darwin' else 'ctrl'
+
+        def paste(text):
+            # Kullanıcı adını paste ederek yaz (i/ı problemi için klavye layout'tan bağımsız)
+            self.clipboard_clear()
+            self.clipboard_append(text)
+            self.update()
+            pyautogui.hotkey(mod, 'v')
 
-                return {"rank_tier": tier, "rank_div": div, "lp": lp, "winrate": wr_text}
+        def clear_and_paste_id():
+            pyautogui.hotkey(mod, 'a')
+            pyautogui.press('backspace')
+            paste(acc['login_id'])
 
-            return {"rank_tier": "UNRANKED", "rank_div": "", "lp": 0, "winrate": ""}
+        self.run_login_steps([
+            clear_and_paste_id,
+            lambda: pyautogui.press('tab'),
+            lambda: paste(acc['login_pw']),
+            lambda: pyautogui.press('enter'),
+        ])
 
+    def run_login_steps(self, steps):
+        try:
+            steps[0]()
         except Exception as e:
-            print("LoG SCRAPE EXCEPTION:", e)
-            return None
+            print("AUTO LOGIN ERROR:", e)
+            return
+        if len(steps) > 1:
+            self.after(LOGIN_STEP_DELAY_MS, lambda: self.run_login_steps(steps[1:]))
 
     def update_ranks_from_api(self):
-        def fetch():
-            self.refresh_btn.configure(state="disabled", text="UPDATING...")
-            for acc in self.accounts:
-                try:
-                    print(f"{acc['riot_id']} için Web Scraping yapılıyor...")
-                    scraped_data = self.fetch_rank_without_api(acc['server'], acc['riot_id'])
-                    if scraped_data:
-                        acc.update(scraped_data)
-                except Exception as e:
-                    print(e)
-                time.sleep(1.5)
+        accounts = list(self.accounts)
+        pool = self.make_rank_pool()
+        counts = {"done": 0, "failed": 0, "finished": False}
+
+        def refresh_status():
+            # drain, post_latest'i kuyruktan sonra çalıştırır; bitmişse son yazıyı ezme
+            if not counts["finished"]:
+                self.refresh_btn.configure(text=f"UPDATING... {counts['done']}/{len(accounts)}")
+
+        def apply_batch(batch):
+            for acc, scraped_data, error in batch:
+                counts["done"] += 1
+                if scraped_data:
+                    acc.update(scraped_data)
+                elif error:
+                    counts["failed"] += 1
+            self.ui.post_latest("rank_refresh_status", refresh_status)
+
+        def finish():
+            counts["finished"] = True
             self.save_data()
-            self.after(0, lambda: self.filter_accounts(None))
-            self.after(0, lambda: self.refresh_btn.configure(state="normal", text="UPDATE RANKS"))
+            if counts["failed"]:
+                # hatalar stdout yerine butonda kısa süre gösterilir
+                failed_text = f"UPDATE RANKS ({counts['failed']} failed)"
+                self.refresh_btn.configure(state="normal", text=failed_text)
+                self.after(3000, lambda: self.refresh_btn.cget("text") == failed_text
+                           and self.refresh_btn.configure(text="UPDATE RANKS"))
+            else:
+                self.refresh_btn.configure(state="normal", text="UPDATE RANKS")
+
+        def fetch():
+            pool.run(accounts, lambda batch: self.ui.post(lambda b=batch: apply_batch(b)))
+            self.ui.post(finish)
+
+        self.refresh_btn.configure(state="disabled", text="UPDATING...")
         threading.Thread(target=fetch).start()
 
+    def make_rank_pool(self):
+        return make_rank_checker(
+            workers=self.scrape_workers,
+            rate=self.scrape_rate,
+            burst=self.scrape_burst,
+            cache=rank_cache
+        )
+
 if __name__ == "__main__":
     app = LolManagerApp()
+    if startup_report.enabled:
+        startup_report.mark("app_init")
+        app.after_idle(lambda: startup_report.finish(os.path.join(CACHE_DIR, "startup_report.json")))
     app.mainloop()
\ No newline at end of file
@@ -6,7 +6,11 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('assets', 'assets')],
-    hiddenimports=[],
+    hiddenimports=[
+        # lazy_import() ile yüklenenler, PyInstaller statik analizde göremez
+        'pyautogui', 'PIL.Image', 'cryptography.fernet', 'requests', 'urllib3',
+        'bs4', 'fake_useragent', 'aiohttp', 'lxml.etree', 'websocket',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,220 @@
+"""Timings of the account hot paths on synthetic DBs, as JSON that can be diffed between commits.
+
+Run from the repository root (no Tk needed):
+
+    python -m benchmarks.bench_hot_paths [--sizes 100,1000,10000,50000] [--repeat 5]
+        [--json results.json] [--compare baseline.json]
+
+Covers normalize_id, rank_score, the account list filter/sort (AccountSearchIndex), the Fernet-encrypted
+SQLite store (full save, load, no-op and one-row saves, password decrypt) and the League of Graphs rank parse.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import bench_rank_parse
+from benchmarks.synthetic import BenchCipher, SERVERS, make_accounts, remove_store
+from search import AccountSearchIndex, rank_score
+from store import AccountStore
+from utils import normalize_id
+
+DEFAULT_SIZES = (100, 1000, 10000, 50000)
+# arama kutusuna yazılan tipik metinler: Türkçe karakterli, katlanmış hali, tag ve not
+QUERIES = ("Şeker", "seker", "#tr1", "ödül")
+
+
+def best_of(repeat, fn, setup=None):
+    """Best wall time in ms; setup() runs untimed before each round and its result is passed to fn."""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup:
+            arg = setup()
+            started = time.perf_counter()
+            fn(arg)
+        else:
+            started = time.perf_counter()
+            fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def row(bench, size, best_ms, **extra):
+    per_item = best_ms * 1000 / size if size else None
+    return dict(bench=bench, size=size, best_ms=round(best_ms, 3),
+                per_item_us=round(per_item, 3) if per_item is not None else None, **extra)
+
+
+def bench_ids(accounts, repeat):
+    riot_ids = [acc["riot_id"] for acc in accounts]
+    size = len(riot_ids)
+
+    def cold():
+        normalize_id.cache_clear()
+        for riot_id in riot_ids:
+            normalize_id(riot_id)
+
+    def warm():
+        for riot_id in riot_ids:
+            normalize_id(riot_id)
+
+    results = [row("normalize_id/cold", size, best_of(repeat, cold))]
+    warm()
+    results.append(row("normalize_id/warm", size, best_of(repeat, warm)))
+    results.append(row("rank_score", size, best_of(repeat, lambda: [rank_score(acc) for acc in accounts])))
+    return results
+
+
+def bench_search(accounts, repeat):
+    size = len(accounts)
+    index = AccountSearchIndex()
+    results = [row("search/rebuild", size, best_of(repeat, lambda: index.rebuild(accounts)))]
+
+    def sort_all(_):
+        for server in SERVERS:
+            index.query(server)
+
+    results.append(row("search/sort_cold", size, best_of(repeat, sort_all, setup=index.sorted_cache.clear)))
+
+    def filter_all():
+        for server in SERVERS:
+            for text in QUERIES:
+                index.query(server, text)
+
+    results.append(row("search/filter", size, best_of(repeat, filter_all), queries=len(SERVERS) * len(QUERIES)))
+    return results
+
+
+def bench_store(count, workdir, repeat):
+    path = os.path.join(workdir, f"accounts_{count}.db")
+    cipher = BenchCipher()
+
+    def open_store():
+        return AccountStore(BenchCipher(cipher.key), path=path, legacy_path=None)
+
+    def empty_store():
+        # her turda boş DB: her şifre yeniden Fernet'ten geçer
+        remove_store(path)
+        return open_store(), make_accounts(count)
+
+    def full_save(args):
+        store, accounts = args
+        store.save(accounts)
+        store.close()
+
+    results = [row("store/save_full", count, best_of(repeat, full_save, setup=empty_store))]
+
+    def load(store):
+        store.load()
+        store.close()
+
+    results.append(row("store/load", count, best_of(repeat, load, setup=open_store)))
+
+    store = open_store()
+    accounts = store.load()
+    results.append(row("store/save_noop", count, best_of(repeat, lambda: store.save(accounts))))
+
+    def touch_one():
+        accounts[0]["lp"] = accounts[0].get("lp", 0) + 1
+        store.save(accounts)
+
+    results.append(row("store/save_one", count, best_of(repeat, touch_one)))
+    store.close()
+
+    def fresh_accounts():
+        s = open_store()
+        loaded = s.load()
+        s.close()
+        return loaded
+
+    def decrypt_all(loaded):
+        for acc in loaded:
+            acc["login_pw"]
+
+    results.append(row("store/decrypt_all", count, best_of(repeat, decrypt_all, setup=fresh_accounts)))
+    return results
+
+
+def bench_parse(repeat):
+    return [
+        row(f"parse_rank_html/{r['parser']}/{os.path.splitext(r['fixture'])[0]}", 1, r["best_ms"],
+            peak_kib=r["peak_kib"])
+        for r in bench_rank_parse.run(repeat)
+    ]
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+                             cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run(sizes, repeat):
+    results = []
+    with tempfile.TemporaryDirectory(prefix="lolhub_bench_") as workdir:
+        for size in sizes:
+            accounts = make_accounts(size)
+            results += bench_ids(accounts, repeat)
+            results += bench_search(accounts, repeat)
+            results += bench_store(size, workdir, repeat)
+    results += bench_parse(repeat)
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "sizes": list(sizes),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def load_baseline(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {(r["bench"], r["size"]): r["best_ms"] for r in data.get("results", [])}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                    help="comma-separated account counts")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--json", dest="json_path", help="write the results here ('-' for stdout)")
+    ap.add_argument("--compare", help="earlier --json output; adds a ratio column (new / old)")
+    args = ap.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    report = run(sizes, args.repeat)
+    baseline = load_baseline(args.compare) if args.compare else {}
+
+    out = sys.stderr if args.json_path == "-" else sys.stdout
+    print(f"{'bench':<56} {'size':>7} {'best ms':>10} {'us/item':>9} {'vs base':>8}", file=out)
+    for r in report["results"]:
+        old = baseline.get((r["bench"], r["size"]))
+        if old:
+            r["baseline_ms"] = old
+            r["ratio"] = round(r["best_ms"] / old, 3)
+        ratio = f"{r['ratio']:.2f}x" if "ratio" in r else ""
+        per_item = r["per_item_us"] if r["per_item_us"] is not None else ""
+        print(f"{r['bench']:<56} {r['size']:>7} {r['best_ms']:>10} {per_item:>9} {ratio:>8}", file=out)
+
+    if args.json_path == "-":
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
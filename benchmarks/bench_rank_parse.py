@@ -0,0 +1,86 @@
+"""Parse time and peak memory of the League of Graphs rank extraction paths.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_rank_parse [--repeat 20]
+
+The fixtures are generated pages shaped like League of Graphs profiles (rank block plus ~300 KB of
+filler markup), not recorded responses. log_profile_malformed.html has an unclosed tag in the LP node;
+log_profile_script_decoy.html has rank markup inside <script>/<style> before the real block.
+"""
+import argparse
+import os
+import time
+import tracemalloc
+
+import scraper
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURES = (
+    "log_profile_ranked.html", "log_profile_unranked.html",
+    "log_profile_malformed.html", "log_profile_script_decoy.html",
+)
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def parsers():
+    paths = [
+        ("bs4 (full tree)", scraper.parse_rank_html_soup),
+        ("extractor (stdlib)", lambda html: scraper.parse_rank_html(html, use_lxml=False)),
+    ]
+    if scraper.etree is not None:
+        paths.append(("extractor (lxml)", lambda html: scraper.parse_rank_html(html, use_lxml=True)))
+    return paths
+
+
+def time_parse(fn, html, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(html)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def peak_memory(fn, html):
+    tracemalloc.start()
+    try:
+        fn(html)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run(repeat):
+    results = []
+    for fixture in FIXTURES:
+        html = load_fixture(fixture)
+        expected = scraper.parse_rank_html_soup(html)
+        for label, fn in parsers():
+            result = fn(html)
+            if result != expected:
+                raise AssertionError(f"{label} on {fixture}: {result} != {expected}")
+            results.append({
+                "fixture": fixture,
+                "parser": label,
+                "best_ms": round(time_parse(fn, html, repeat), 3),
+                "peak_kib": round(peak_memory(fn, html), 1),
+            })
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+    print(f"{'fixture':<28} {'parser':<20} {'best ms':>10} {'peak KiB':>10}")
+    for row in run(args.repeat):
+        print(f"{row['fixture']:<28} {row['parser']:<20} {row['best_ms']:>10} {row['peak_kib']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Headless check that ChampSelectState only hands out an action again when its state changes.
+
+Run from the repository root:
+
+    python -m benchmarks.check_champ_select
+"""
+import argparse
+import copy
+
+from lcu import ChampSelectState
+
+TARGET = 157
+LOCAL_CELL = 2
+
+
+def make_session(pick_in_progress=False, pick_champion=0, other_hover=0, completed=False):
+    return {
+        "gameId": 1,
+        "localPlayerCellId": LOCAL_CELL,
+        "actions": [[
+            {"id": 5, "actorCellId": LOCAL_CELL, "type": "pick", "championId": pick_champion,
+             "isInProgress": pick_in_progress, "completed": completed},
+            {"id": 6, "actorCellId": 7, "type": "pick", "championId": other_hover,
+             "isInProgress": True, "completed": False},
+        ]],
+    }
+
+
+def sent_ids(state, session):
+    state.update(copy.deepcopy(session))
+    return [action["id"] for action in state.take_new("pick", TARGET)]
+
+
+def run():
+    state = ChampSelectState(handler=None)
+    steps = [
+        ("first snapshot", make_session(), [5]),
+        ("same snapshot again", make_session(), []),
+        ("third identical update", make_session(), []),
+        ("early PATCH accepted as a hover", make_session(pick_champion=TARGET), []),
+        ("another player hovers", make_session(pick_champion=TARGET, other_hover=86), []),
+        ("our turn starts", make_session(pick_in_progress=True, pick_champion=TARGET), [5]),
+        ("timer phase update", make_session(pick_in_progress=True, pick_champion=TARGET), []),
+        ("champion changed by hand", make_session(pick_in_progress=True, pick_champion=22), [5]),
+        ("action completed", make_session(pick_in_progress=True, pick_champion=TARGET, completed=True), []),
+    ]
+    results = []
+    for label, session, expected in steps:
+        got = sent_ids(state, session)
+        results.append({"step": label, "sent": got, "ok": got == expected})
+
+    # başarısız PATCH release() ile bir sonraki snapshot'ta tekrar gönderilir
+    state = ChampSelectState(handler=None)
+    sent_ids(state, make_session(pick_in_progress=True))
+    state.release(5)
+    got = sent_ids(state, make_session(pick_in_progress=True))
+    results.append({"step": "resend after failed PATCH", "sent": got, "ok": got == [5]})
+    return results
+
+
+def main():
+    argparse.ArgumentParser(description=__doc__.splitlines()[0]).parse_args()
+    results = run()
+    for r in results:
+        print(f"{'ok' if r['ok'] else 'FAIL':<5} {r['step']:<34} sent={r['sent']}")
+    if not all(r["ok"] for r in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
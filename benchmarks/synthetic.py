@@ -0,0 +1,95 @@
+"""Synthetic account databases for the benchmarks (seeded, so every run sees the same data).
+
+    python -m benchmarks.synthetic bench_accounts.db --count 10000 [--seed 1]
+
+The Fernet key is written next to the database as <path>.key.
+"""
+import argparse
+import os
+import random
+
+from crypto import CipherManager, fernet
+from scraper import LOG_REGIONS
+from store import AccountStore, apply_account_defaults
+
+# Türkçe karakterler, aksanlar ve Latin dışı alfabeler normalize_id/fold_text'i zorlasın
+NAME_PARTS = (
+    "Şeker", "Iğdır", "Çılgın", "Öğretmen", "Güneş", "İstanbul", "Kılıç", "Ağaçkakan",
+    "Yıldız", "Böğürtlen", "Ñandú", "Zoë", "Łukasz", "Ærøskøbing", "Café", "Kirill",
+    "Кирилл", "東京", "Faker", "Mid", "Jungle", "Support", "Sniper", "Ghost", "Dragon",
+)
+TAGS = ("TR1", "EUW", "ÇAY", "0001", "ŞİMŞ", "GÜL", "NA1", "KR1")
+# the app's own server codes, so build_profile_url takes its real region mapping
+SERVERS = tuple(LOG_REGIONS)
+TIERS = ("IRON", "BRONZE", "SILVER", "GOLD", "PLATINUM", "EMERALD", "DIAMOND", "MASTER", "UNRANKED")
+DIVISIONS = ("I", "II", "III", "IV")
+NOTES = ("", "", "", "main", "smurf", "ödül hesabı", "Çok iyi", "ban riski", "arkadaşın")
+
+
+class BenchCipher(CipherManager):
+    """CipherManager with its own key (fresh if none is given), so benchmark DBs never use the real secret.key."""
+
+    def __init__(self, key=None):
+        self.bench_key = key
+        super().__init__()
+
+    def load_key(self):
+        return self.bench_key or fernet.Fernet.generate_key()
+
+
+def make_account(rng, n):
+    tier = rng.choice(TIERS)
+    acc = {
+        "riot_id": f"{rng.choice(NAME_PARTS)} {rng.choice(NAME_PARTS)}{n}#{rng.choice(TAGS)}",
+        "login_id": f"user{n}_{rng.randrange(10**6):06d}",
+        "login_pw": "".join(rng.choice("abcdefghijkmnpqrstuvwxyz23456789!?") for _ in range(12)),
+        "server": rng.choice(SERVERS),
+        "note": rng.choice(NOTES),
+        "rank_tier": tier,
+    }
+    if tier not in ("UNRANKED", "MASTER"):
+        acc["rank_div"] = rng.choice(DIVISIONS)
+        acc["lp"] = rng.randrange(100)
+    elif tier == "MASTER":
+        acc["lp"] = rng.randrange(1500)
+    acc["level"] = rng.randrange(30, 600)
+    acc["blue_essence"] = rng.randrange(100000)
+    return apply_account_defaults(acc)
+
+
+def make_accounts(count, seed=1):
+    rng = random.Random(seed)
+    return [make_account(rng, n) for n in range(count)]
+
+
+def remove_store(path):
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def build_store(path, count, seed=1, cipher=None):
+    """Fresh encrypted SQLite store at path with count accounts; returns (store, accounts)."""
+    remove_store(path)
+    store = AccountStore(cipher or BenchCipher(), path=path, legacy_path=None)
+    accounts = make_accounts(count, seed)
+    store.save(accounts)
+    return store, accounts
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("path")
+    ap.add_argument("--count", type=int, default=1000)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+    cipher = BenchCipher()
+    store, accounts = build_store(args.path, args.count, args.seed, cipher)
+    store.close()
+    with open(args.path + ".key", "wb") as f:
+        f.write(cipher.key)
+    print(f"{len(accounts)} accounts written to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
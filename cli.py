@@ -0,0 +1,175 @@
+"""Headless account maintenance for batch jobs (no customtkinter/pyautogui).
+
+    python cli.py refresh-ranks [--workers 4] [--rate 2.0] [--burst 4] [--server TR1]
+    python cli.py export lol_accounts_backup.json
+    python cli.py import lol_accounts_backup.json [--merge]
+
+Progress goes to stdout as one JSON object per line ("start", "progress"/"account", "done" or "error").
+"""
+import argparse
+import json
+import sys
+import time
+from crypto import cipher_man
+import scraper
+from scraper import (
+    RankCheckPool, AsyncRankScraper, make_rank_checker, rank_cache, LOG_REGIONS,
+    SCRAPE_WORKERS, SCRAPE_RATE, SCRAPE_BURST, RANK_CACHE_TTL
+)
+from search import AccountSearchIndex
+from store import AccountStore, apply_account_defaults
+from utils import CONFIG_FILE, ensure_cache_dir
+
+ENGINES = {"auto": make_rank_checker, "threads": RankCheckPool, "async": AsyncRankScraper}
+
+
+def emit(event, **fields):
+    print(json.dumps(dict(event=event, **fields), ensure_ascii=False), flush=True)
+
+
+def load_config():
+    try:
+        with open(CONFIG_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def open_store():
+    store = AccountStore(cipher_man)
+    accounts = store.load()
+    for acc in accounts:
+        apply_account_defaults(acc)
+    return store, accounts
+
+
+def cmd_refresh_ranks(args):
+    if args.engine == "async" and scraper.aiohttp is None:
+        emit("error", message="aiohttp is not installed; use --engine threads")
+        return 2
+    store, accounts = open_store()
+    targets = [acc for acc in accounts if not args.server or acc.get("server") == args.server]
+    rank_cache.ttl = args.cache_ttl
+    checker = ENGINES[args.engine](workers=args.workers, rate=args.rate, burst=args.burst, cache=rank_cache)
+    total = len(targets)
+    counts = {"done": 0, "failed": 0}
+    started = time.perf_counter()
+    emit("start", command="refresh-ranks", total=total, engine=type(checker).__name__)
+
+    def on_batch(batch):
+        for acc, result, error in batch:
+            counts["done"] += 1
+            row = {"done": counts["done"], "total": total, "riot_id": acc["riot_id"], "server": acc["server"]}
+            if result:
+                acc.update(result)
+                emit("account", ok=True, **row, **result)
+            else:
+                counts["failed"] += 1
+                emit("account", ok=False, **row, error=str(error) if error else "no result")
+        # her batch kaydedilir; iş yarıda kesilse de biten hesaplar kaybolmaz
+        store.save(accounts)
+
+    try:
+        checker.run(targets, on_batch, batch_size=args.batch_size)
+    except KeyboardInterrupt:
+        checker.stop()
+        emit("error", message="interrupted", done=counts["done"], total=total)
+        return 130
+    finally:
+        store.close()
+    emit("done", command="refresh-ranks", total=total, failed=counts["failed"],
+         seconds=round(time.perf_counter() - started, 2))
+    return 0 if counts["failed"] == 0 else 1
+
+
+def cmd_export(args):
+    store, accounts = open_store()
+    store.close()
+    total = len(accounts)
+    emit("start", command="export", total=total)
+    data = []
+    for done, acc in enumerate(accounts, 1):
+        # şifreler yalnızca ihtiyaç olunca çözülüyor, export için hepsini aç
+        data.append(dict(acc, login_pw=acc['login_pw']))
+        if done % args.progress_every == 0 or done == total:
+            emit("progress", done=done, total=total)
+    with open(args.path, "w") as f:
+        json.dump(data, f, indent=4)
+    emit("done", command="export", total=total, path=args.path)
+    return 0
+
+
+def cmd_import(args):
+    try:
+        with open(args.path, "r") as f:
+            new_data = json.load(f)
+    except (OSError, ValueError) as e:
+        emit("error", message=str(e))
+        return 2
+    if not (isinstance(new_data, list) and len(new_data) > 0 and 'login_id' in new_data[0]):
+        emit("error", message="Invalid backup file format.")
+        return 2
+
+    store, accounts = open_store()
+    emit("start", command="import", total=len(new_data), merge=args.merge)
+    skipped = 0
+    if args.merge:
+        index = AccountSearchIndex()
+        index.rebuild(accounts)
+        for acc in new_data:
+            if index.find_by_riot_id(acc['riot_id'], acc.get('server')):
+                skipped += 1
+                continue
+            acc.pop("id", None)
+            accounts.append(apply_account_defaults(acc))
+            index.update(acc)
+    else:
+        accounts = [apply_account_defaults(acc) for acc in new_data]
+    try:
+        written = store.save(accounts)
+    finally:
+        store.close()
+    emit("done", command="import", accounts=len(accounts), skipped=skipped, rows_written=written)
+    return 0
+
+
+def build_parser():
+    config = load_config()
+    ap = argparse.ArgumentParser(prog="cli.py", description=__doc__.splitlines()[0])
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("refresh-ranks", help="scrape League of Graphs ranks for saved accounts")
+    p.add_argument("--workers", type=int, default=config.get("scrape_workers", SCRAPE_WORKERS),
+                   help="concurrent requests")
+    p.add_argument("--rate", type=float, default=config.get("scrape_rate", SCRAPE_RATE),
+                   help="requests per second")
+    p.add_argument("--burst", type=int, default=config.get("scrape_burst", SCRAPE_BURST),
+                   help="requests allowed back to back before the rate limit applies")
+    p.add_argument("--cache-ttl", type=float, default=config.get("rank_cache_ttl", RANK_CACHE_TTL),
+                   help="seconds a cached rank is reused without asking the site")
+    p.add_argument("--engine", choices=sorted(ENGINES), default="auto")
+    p.add_argument("--server", choices=list(LOG_REGIONS), help="only accounts on this server, e.g. TR1")
+    p.add_argument("--batch-size", type=int, default=10, help="accounts per save")
+    p.set_defaults(func=cmd_refresh_ranks)
+
+    p = sub.add_parser("export", help="write all accounts with decrypted passwords to a JSON backup")
+    p.add_argument("path")
+    p.add_argument("--progress-every", type=int, default=500)
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("import", help="load a JSON backup into the account store")
+    p.add_argument("path")
+    p.add_argument("--merge", action="store_true",
+                   help="keep existing accounts and only add Riot IDs that are not saved yet")
+    p.set_defaults(func=cmd_import)
+    return ap
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    ensure_cache_dir()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+import os
+from startup import lazy_import
+from utils import KEY_FILE
+
+fernet = lazy_import("cryptography.fernet")
+
+
+class CipherManager:
+    def __init__(self):
+        self._key = None
+        self._cipher = None
+
+    @property
+    def key(self):
+        # anahtar dosyası ilk kullanımda okunur/oluşturulur; modülü import etmek diske dokunmaz
+        if self._key is None:
+            self._key = self.load_key()
+        return self._key
+
+    @property
+    def cipher(self):
+        if self._cipher is None:
+            self._cipher = fernet.Fernet(self.key)
+        return self._cipher
+
+    def load_key(self):
+        if os.path.exists(KEY_FILE):
+            with open(KEY_FILE, "rb") as f:
+                return f.read()
+        else:
+            key = fernet.Fernet.generate_key()
+            with open(KEY_FILE, "wb") as f:
+                f.write(key)
+            return key
+
+    def encrypt(self, text):
+        return self.cipher.encrypt(text.encode()).decode()
+
+    def decrypt(self, encrypted_text):
+        try:
+            return self.cipher.decrypt(encrypted_text.encode()).decode()
+        except:
+            return encrypted_text
+
+
+cipher_man = CipherManager()
@@ -0,0 +1,79 @@
+import json
+import os
+import shutil
+from startup import lazy_import
+from utils import CACHE_DIR
+
+requests = lazy_import("requests")
+
+DDRAGON_VERSIONS_URL = "https://ddragon.leagueoflegends.com/api/versions.json"
+DDRAGON_CHAMPIONS_URL = "https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/champion.json"
+DDRAGON_TIMEOUT = 5
+DDRAGON_DIR = os.path.join(CACHE_DIR, "ddragon")
+VERSIONS_FILE = os.path.join(DDRAGON_DIR, "versions.json")
+
+FALLBACK_CHAMPIONS = {"Yasuo": 157, "Yone": 777}
+
+
+def champion_file(version):
+    return os.path.join(DDRAGON_DIR, version, "champion.json")
+
+
+def read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def champions_from_data(data):
+    champs = {}
+    for k, v in data['data'].items():
+        champs[v['name']] = int(v['key'])
+    return champs
+
+
+def cached_version():
+    versions = read_json(VERSIONS_FILE)
+    if isinstance(versions, list) and versions:
+        return versions[0]
+    return None
+
+
+def load_cached_champions():
+    """Champion name -> id map from the last downloaded patch, or None if nothing is cached."""
+    version = cached_version()
+    if not version:
+        return None
+    data = read_json(champion_file(version))
+    try:
+        return champions_from_data(data)
+    except (TypeError, KeyError, ValueError):
+        return None
+
+
+def refresh_champions():
+    """Checks DDragon for a newer patch; returns the new map when one was downloaded, else None."""
+    versions = requests.get(DDRAGON_VERSIONS_URL, timeout=DDRAGON_TIMEOUT).json()
+    latest = versions[0]
+    if latest == cached_version() and os.path.exists(champion_file(latest)):
+        return None
+    data = requests.get(DDRAGON_CHAMPIONS_URL.format(version=latest), timeout=DDRAGON_TIMEOUT).json()
+    champs = champions_from_data(data)
+    write_json(champion_file(latest), data)
+    write_json(VERSIONS_FILE, versions)
+    # eski patch klasörlerini temizle
+    for entry in os.listdir(DDRAGON_DIR):
+        path = os.path.join(DDRAGON_DIR, entry)
+        if entry != latest and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+    return champs
@@ -0,0 +1,113 @@
+import hashlib
+import io
+import math
+import os
+import threading
+from collections import OrderedDict
+from startup import lazy_import
+from utils import CACHE_DIR, resource_path
+
+Image = lazy_import("PIL.Image")
+requests = lazy_import("requests")
+
+IMAGE_CACHE_DIR = os.path.join(CACHE_DIR, "images")
+# decoded images kept in memory / bytes of downloaded art kept on disk
+IMAGE_CACHE_SIZE = 256
+IMAGE_DISK_BUDGET = 50 * 1024 * 1024
+IMAGE_TIMEOUT = 5
+
+
+def asset_path(*parts):
+    """Bundled asset (PyInstaller or source tree), or None if it is missing."""
+    for path in (resource_path(os.path.join("assets", *parts)),
+                 os.path.join(os.path.abspath("."), "assets", *parts)):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def downsample(image, size):
+    """RGBA copy no larger than size (w, h); small images are left as they are."""
+    image = image.convert("RGBA")
+    if image.width > size[0] or image.height > size[1]:
+        image = image.resize(size, Image.LANCZOS)
+    return image
+
+
+class ImageCache:
+    """Each file is decoded once per display size and kept in a bounded LRU.
+
+    Remote art (skins, champion splashes) goes through fetch(), which also keeps the
+    down-sampled PNGs on disk under CACHE_DIR/images, oldest-used first out.
+    """
+
+    def __init__(self, max_items=IMAGE_CACHE_SIZE, disk_dir=IMAGE_CACHE_DIR, disk_budget=IMAGE_DISK_BUDGET):
+        self.max_items = max_items
+        self.disk_dir = disk_dir
+        self.disk_budget = disk_budget
+        self.items = OrderedDict()  # (path, size) -> PIL image
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def pixel_size(size, scale=1.0):
+        return (math.ceil(size[0] * scale), math.ceil(size[1] * scale))
+
+    def get(self, path, size):
+        key = (path, tuple(size))
+        with self.lock:
+            image = self.items.get(key)
+            if image is not None:
+                self.items.move_to_end(key)
+                return image
+        with Image.open(path) as src:
+            image = downsample(src, key[1])
+        self.remember(key, image)
+        return image
+
+    def remember(self, key, image):
+        with self.lock:
+            self.items[key] = image
+            self.items.move_to_end(key)
+            while len(self.items) > self.max_items:
+                self.items.popitem(last=False)
+
+    def disk_path(self, url, size):
+        digest = hashlib.sha1(f"{url}|{size[0]}x{size[1]}".encode()).hexdigest()
+        return os.path.join(self.disk_dir, digest + ".png")
+
+    def fetch(self, url, size):
+        size = tuple(size)
+        path = self.disk_path(url, size)
+        if os.path.exists(path):
+            os.utime(path)  # LRU sırası için son kullanım zamanı
+            return self.get(path, size)
+        r = requests.get(url, timeout=IMAGE_TIMEOUT)
+        r.raise_for_status()
+        with Image.open(io.BytesIO(r.content)) as src:
+            image = downsample(src, size)
+        os.makedirs(self.disk_dir, exist_ok=True)
+        tmp_path = path + ".tmp"
+        image.save(tmp_path, "PNG")
+        os.replace(tmp_path, path)
+        self.trim_disk()
+        self.remember((path, size), image)
+        return image
+
+    def trim_disk(self):
+        entries = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.is_file() and entry.name.endswith(".png"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+        total = sum(e[1] for e in entries)
+        for mtime, size, path in sorted(entries):
+            if total <= self.disk_budget:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+image_cache = ImageCache()
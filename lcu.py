@@ -0,0 +1,750 @@
+import base64
+import codecs
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import ssl
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from startup import lazy_import
+
+requests = lazy_import("requests")
+urllib3 = lazy_import("urllib3")
+# websocket-client yoksa polling'e düşülür
+websocket = lazy_import("websocket", optional=True)
+
+# (connect, read) timeouts in seconds, per endpoint class
+LCU_TIMEOUTS = {
+    "gameflow": (1.0, 2.0),
+    "inventory": (2.0, 10.0),
+    "default": (2.0, 5.0),
+}
+
+ENDPOINT_CLASSES = (
+    ("/lol-gameflow/", "gameflow"),
+    ("/lol-matchmaking/", "gameflow"),
+    ("/lol-champ-select/", "gameflow"),
+    ("/lol-inventory/", "inventory"),
+    ("/lol-store/", "inventory"),
+)
+
+# LCU WAMP message types
+WAMP_SUBSCRIBE = 5
+WAMP_EVENT = 8
+
+GAMEFLOW_PHASE_URI = "/lol-gameflow/v1/gameflow-phase"
+READY_CHECK_URI = "/lol-matchmaking/v1/ready-check"
+CHAMP_SELECT_URI = "/lol-champ-select/v1/session"
+
+# eşzamanlı LCU istekleri; session havuzu (pool_maxsize) ile aynı boyut
+LCU_WORKERS = 8
+# overall deadline (s) for a gather() batch
+LCU_BATCH_DEADLINE = 10.0
+STREAM_CHUNK_SIZE = 64 * 1024
+
+LOCKFILE_NAME = "lockfile"
+# polling aralığı (inotify yoksa) ve inotify beklerken stop() kontrolü için üst sınır
+LOCKFILE_POLL_INTERVAL = 1.0
+LOCKFILE_NOTIFY_TIMEOUT = 2.0
+LOCKFILE_DISCOVER_INTERVAL = 5.0
+# seconds before a request failure lets the same credentials be tried again
+REVIVE_DELAY = 3.0
+# cheap GET that answers as soon as the client's API is up
+REVIVE_PROBE_URI = GAMEFLOW_PHASE_URI
+
+# inotify(7) event bits
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+
+# background_loop poll interval (s) per gameflow phase
+PHASE_POLL_INTERVALS = {
+    "ReadyCheck": 0.5,
+    "ChampSelect": 0.5,
+    "Matchmaking": 1.0,
+    "Lobby": 2.0,
+    "PreEndOfGame": 5.0,
+    "EndOfGame": 5.0,
+    "InProgress": 10.0,
+    "Reconnect": 10.0,
+    "WaitingForStats": 10.0,
+    "None": 10.0,
+}
+DEFAULT_POLL_INTERVAL = 3.0
+# bağlantı yokken 1, 2, 4 ... 30 sn
+DISCONNECTED_BACKOFF = (1.0, 30.0)
+
+# upper bounds (ms) of the latency histogram buckets, last bucket is open ended
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms):
+        idx = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                idx = i
+                break
+        self.counts[idx] += 1
+        self.total += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def snapshot(self):
+        labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.total,
+            "avg_ms": round(self.sum_ms / self.total, 1) if self.total else 0,
+            "max_ms": round(self.max_ms, 1),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+def count_json_array(chunks):
+    """Number of top-level items in a streamed JSON array, decoding one item at a time; None if it is not an array."""
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buf = ""
+    pos = 0
+    count = 0
+    opened = False
+    eof = False
+    while True:
+        while pos < len(buf) and (buf[pos] in " \t\r\n" or (opened and buf[pos] == ",")):
+            pos += 1
+        if pos >= len(buf) and not eof:
+            chunk = next(chunks, None)
+            eof = chunk is None
+            buf = buf[pos:] + utf8.decode(chunk or b"", final=eof)
+            pos = 0
+            continue
+        if pos >= len(buf):
+            return None  # yarım kalmış yanıt
+        if not opened:
+            if buf[pos] != "[":
+                return None
+            opened = True
+            pos += 1
+            continue
+        if buf[pos] == "]":
+            return count
+        try:
+            _, end = decoder.raw_decode(buf, pos)
+        except ValueError:
+            end = None
+        # bir sayı chunk sonunda kesilmiş olabilir; arkasından bir şey gelene kadar güvenme
+        if end is None or (end >= len(buf) and not eof):
+            if eof:
+                return None
+            chunk = next(chunks, None)
+            eof = chunk is None
+            buf = buf[pos:] + utf8.decode(chunk or b"", final=eof)
+            pos = 0
+            continue
+        count += 1
+        pos = end
+
+
+def lcu_install_dirs():
+    if sys.platform == "darwin":
+        return [
+            "/Applications/League of Legends.app/Contents/LoL",
+            "/Applications/Riot Games/League of Legends.app/Contents/LoL"
+        ]
+    return [
+        "C:\\Riot Games\\League of Legends",
+        "D:\\Riot Games\\League of Legends"
+    ]
+
+
+def find_install_dir(cached=None):
+    """Directory holding the LCU lockfile: one where the client is running, else the cached one if it still exists."""
+    candidates = ([cached] if cached else []) + lcu_install_dirs()
+    for directory in candidates:
+        if os.path.exists(os.path.join(directory, LOCKFILE_NAME)):
+            return directory
+    if cached and os.path.isdir(cached):
+        return cached
+    return None
+
+
+def read_lockfile(path):
+    """{"port", "password", "protocol"} from a name:pid:port:password:protocol lockfile, or None."""
+    try:
+        with open(path, 'r') as f:
+            data = f.read().split(':')
+        return {"port": data[2], "password": data[3], "protocol": data[4].strip()}
+    except (OSError, IndexError):
+        return None
+
+
+class DirectoryNotifier:
+    """inotify watch on one directory (Linux only); wait() returns early when something in it changes."""
+
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    @classmethod
+    def open(cls, directory):
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            if libc.inotify_add_watch(fd, os.fsencode(directory), cls.MASK) < 0:
+                os.close(fd)
+                return None
+            return cls(fd)
+        except (OSError, AttributeError):
+            return None
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if ready:
+            try:
+                # olayların içeriği önemli değil, check() dosyanın stat'ına bakar
+                os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                pass
+
+    def close(self):
+        os.close(self.fd)
+
+
+class LockfileWatcher:
+    """Follows one lockfile and publishes its credentials when it appears or changes, and None when it goes away."""
+
+    def __init__(self, find_dir, name=LOCKFILE_NAME, on_discovered=None,
+                 poll_interval=LOCKFILE_POLL_INTERVAL, discover_interval=LOCKFILE_DISCOVER_INTERVAL):
+        self.find_dir = find_dir
+        self.name = name
+        self.on_discovered = on_discovered
+        self.poll_interval = poll_interval
+        self.discover_interval = discover_interval
+        self.directory = None
+        self.signature = None
+        self.credentials = None
+        self.listeners = []
+        self.running = False
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, self.name) if self.directory else None
+
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+
+    def publish(self, credentials):
+        self.credentials = credentials
+        for callback in list(self.listeners):
+            try:
+                callback(credentials)
+            except Exception as e:
+                print("LOCKFILE LISTENER ERROR:", e)
+
+    def check(self):
+        """Re-reads the lockfile only when its stat signature changed; True if the credentials changed."""
+        try:
+            st = os.stat(self.path)
+            signature = (st.st_ino, st.st_size, st.st_mtime_ns)
+        except (OSError, TypeError):
+            signature = None
+        if signature == self.signature:
+            return False
+        self.signature = signature
+        if signature is None:
+            credentials = None  # dosya gerçekten yok
+        else:
+            credentials = read_lockfile(self.path)
+            if credentials is None:
+                # dosya yazılırken okunmuş olabilir; bağlantıyı düşürme, bir sonraki turda tekrar dene
+                self.signature = None
+                return False
+        if credentials == self.credentials:
+            return False
+        self.publish(credentials)
+        return True
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self.stop_event.set()
+
+    def run(self):
+        while self.running and self.directory is None:
+            self.directory = self.find_dir()
+            if self.directory is None:
+                self.stop_event.wait(self.discover_interval)
+            elif self.on_discovered:
+                self.on_discovered(self.directory)
+        notifier = DirectoryNotifier.open(self.directory) if self.running else None
+        try:
+            while self.running:
+                self.check()
+                if notifier:
+                    notifier.wait(LOCKFILE_NOTIFY_TIMEOUT)
+                else:
+                    self.stop_event.wait(self.poll_interval)
+        finally:
+            if notifier:
+                notifier.close()
+
+
+# --- LCU Handler ---
+class LCUHandler:
+    def __init__(self):
+        self.port = None
+        self.password = None
+        self.protocol = "https"
+        self.connected = False
+        self.headers = {}
+        self.timeouts = dict(LCU_TIMEOUTS)
+        self._session = None
+        self._executor = None
+        self.session_lock = threading.Lock()
+
+        self.latency = {}
+        self.latency_lock = threading.Lock()
+
+        self.credentials = None
+        self.listeners = []  # callback(connected)
+        self.state_lock = threading.Lock()
+        self.lost_at = 0.0
+
+    @property
+    def session(self):
+        # tek bir keep-alive session, ilk kullanımda kurulur (requests açılışta import edilmez)
+        if self._session is None:
+            with self.session_lock:
+                if self._session is None:
+                    # SSL Uyarılarını Gizle
+                    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                    session = requests.Session()
+                    session.verify = False
+                    session.headers.update({"Accept": "application/json"})
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=0)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            with self.session_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=LCU_WORKERS, thread_name_prefix="lcu")
+        return self._executor
+
+    def configure_timeouts(self, overrides):
+        """Override (connect, read) timeouts per endpoint class, e.g. {"gameflow": [1, 2]}"""
+        if not isinstance(overrides, dict):
+            return
+        for cls, value in overrides.items():
+            try:
+                connect, read = value
+                self.timeouts[cls] = (float(connect), float(read))
+            except (TypeError, ValueError):
+                continue
+
+    def endpoint_class(self, endpoint):
+        for prefix, cls in ENDPOINT_CLASSES:
+            if endpoint.startswith(prefix):
+                return cls
+        return "default"
+
+    def timeout_for(self, endpoint):
+        return self.timeouts.get(self.endpoint_class(endpoint), self.timeouts["default"])
+
+    def subscribe(self, callback):
+        """callback(connected) on every connect/disconnect transition."""
+        self.listeners.append(callback)
+
+    def set_connected(self, value):
+        with self.state_lock:
+            changed = value != self.connected
+            self.connected = value
+            if not value:
+                self.lost_at = time.monotonic()
+        if changed:
+            for callback in list(self.listeners):
+                try:
+                    callback(value)
+                except Exception as e:
+                    print("LCU LISTENER ERROR:", e)
+
+    def apply_credentials(self, credentials):
+        """Lockfile credentials, or None when the lockfile is gone."""
+        if credentials is None or credentials != self.credentials:
+            self.set_connected(False)
+        if credentials is None:
+            self.credentials = None
+            return
+        self.port = credentials["port"]
+        self.password = credentials["password"]
+        self.protocol = credentials["protocol"]
+        auth_str = f"riot:{self.password}"
+        auth_b64 = base64.b64encode(auth_str.encode()).decode()
+        self.headers = {
+            "Authorization": f"Basic {auth_b64}",
+            "Accept": "application/json"
+        }
+        self.session.auth = ("riot", self.password)
+        self.credentials = credentials
+        self.set_connected(True)
+
+    def revive(self, delay=REVIVE_DELAY):
+        """After a failed request, probes the current credentials again; the lockfile itself is not re-read.
+
+        Only a probe that gets an HTTP answer reports connected, so a dead client does not flap the listeners.
+        """
+        if self.connected or self.credentials is None or time.monotonic() - self.lost_at < delay:
+            return False
+        if not self.probe():
+            with self.state_lock:
+                self.lost_at = time.monotonic()  # bir sonraki deneme yine delay sonra
+            return False
+        self.set_connected(True)
+        return True
+
+    def probe(self):
+        url = f"{self.protocol}://127.0.0.1:{self.port}{REVIVE_PROBE_URI}"
+        try:
+            r = self.session.get(url, timeout=self.timeout_for(REVIVE_PROBE_URI))
+        except Exception:
+            return False
+        r.close()
+        return r.status_code < 500
+
+    def try_connect(self, install_dir=None):
+        """One-shot read of the lockfile; the app keeps a watch() running instead."""
+        directory = find_install_dir(install_dir)
+        credentials = read_lockfile(os.path.join(directory, LOCKFILE_NAME)) if directory else None
+        if credentials is None:
+            self.set_connected(False)
+            return False
+        self.apply_credentials(credentials)
+        return True
+
+    def watch(self, install_dir=None, on_discovered=None):
+        """Starts a LockfileWatcher that keeps port/password/protocol in sync with the client's lockfile."""
+        watcher = LockfileWatcher(lambda: find_install_dir(install_dir), on_discovered=on_discovered)
+        watcher.subscribe(self.apply_credentials)
+        watcher.start()
+        return watcher
+
+    def record_latency(self, endpoint, seconds):
+        key = endpoint.split("?", 1)[0]
+        with self.latency_lock:
+            hist = self.latency.get(key)
+            if hist is None:
+                hist = self.latency[key] = LatencyHistogram()
+            hist.record(seconds * 1000)
+
+    def latency_report(self):
+        with self.latency_lock:
+            return {endpoint: hist.snapshot() for endpoint, hist in self.latency.items()}
+
+    def request(self, method, endpoint, data=None, stream=False):
+        if not self.connected:
+            return None
+        url = f"{self.protocol}://127.0.0.1:{self.port}{endpoint}"
+        started = time.perf_counter()
+        try:
+            return self.session.request(method, url, json=data, timeout=self.timeout_for(endpoint), stream=stream)
+        except requests.Timeout:
+            # istemci yanıt vermiyor ama hâlâ ayakta olabilir; bağlantıyı düşürme
+            return None
+        except Exception:
+            self.set_connected(False)
+            return None
+        finally:
+            self.record_latency(endpoint, time.perf_counter() - started)
+
+    def count_items(self, endpoint):
+        """GETs a JSON array endpoint and counts its items while streaming; None for a truncated or non-array body."""
+        r = self.request("GET", endpoint, stream=True)
+        if r is None:
+            return None
+        try:
+            if r.status_code != 200:
+                return None
+            return count_json_array(r.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+        except Exception:
+            return None
+        finally:
+            r.close()
+
+    def gather(self, jobs, deadline=LCU_BATCH_DEADLINE):
+        """Runs {name: fn} concurrently; returns {name: result}, None for jobs that failed or missed the deadline."""
+        futures = {name: self.executor.submit(fn) for name, fn in jobs.items()}
+        wait(futures.values(), timeout=deadline)
+        results = {}
+        for name, future in futures.items():
+            if not future.done():
+                future.cancel()
+                results[name] = None
+            elif future.cancelled() or future.exception() is not None:
+                results[name] = None
+            else:
+                results[name] = future.result()
+        return results
+
+
+# --- LCU Event Socket ---
+class LCUEventClient:
+    """Subscribes to OnJsonApiEvent messages on the LCU websocket and dispatches them by URI."""
+
+    def __init__(self, handler, url=None, reconnect_delay=2.0):
+        self.handler = handler
+        self.url = url  # sabit url verilirse lockfile yerine onu kullan (yerel test sunucusu için)
+        self.reconnect_delay = reconnect_delay
+        self.listeners = {}
+        self.connected = False
+        self.running = False
+        self.ws = None
+        self.thread = None
+        self.wake = threading.Event()
+        handler.subscribe(self.on_connection)
+
+    @staticmethod
+    def event_name(uri):
+        return "OnJsonApiEvent_" + uri.strip("/").replace("/", "_")
+
+    def on(self, uri, callback):
+        self.listeners.setdefault(uri, []).append(callback)
+
+    def start(self):
+        if websocket is None or self.running:
+            return False
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return True
+
+    def stop(self):
+        self.running = False
+        self.wake.set()
+        if self.ws:
+            self.ws.close()
+
+    def run(self):
+        while self.running:
+            if self.url or self.handler.connected:
+                if self.url:
+                    url, headers = self.url, []
+                else:
+                    scheme = "wss" if self.handler.protocol == "https" else "ws"
+                    url = f"{scheme}://127.0.0.1:{self.handler.port}/"
+                    headers = [f"Authorization: {self.handler.headers.get('Authorization', '')}"]
+                self.ws = websocket.WebSocketApp(
+                    url,
+                    header=headers,
+                    on_open=self.on_open,
+                    on_message=self.on_message,
+                    on_close=self.on_close,
+                    on_error=self.on_error
+                )
+                self.ws.run_forever(sslopt={"cert_reqs": ssl.CERT_NONE})
+                self.connected = False
+                self.ws = None
+            if self.running:
+                # lockfile değişince on_connection beklemeyi keser
+                self.wake.wait(self.reconnect_delay)
+                self.wake.clear()
+
+    def on_connection(self, connected):
+        if connected:
+            self.wake.set()
+        elif self.ws and not self.url:
+            self.ws.close()
+
+    def on_open(self, ws):
+        for uri in self.listeners:
+            ws.send(json.dumps([WAMP_SUBSCRIBE, self.event_name(uri)]))
+        self.connected = True
+
+    def on_close(self, ws, *args):
+        self.connected = False
+
+    def on_error(self, ws, error):
+        self.connected = False
+
+    def on_message(self, ws, message):
+        try:
+            msg = json.loads(message)
+        except ValueError:
+            return
+        if not isinstance(msg, list) or len(msg) < 3 or msg[0] != WAMP_EVENT:
+            return
+        payload = msg[2]
+        if isinstance(payload, dict):
+            self.dispatch(payload.get("uri"), payload.get("data"), payload.get("eventType"))
+
+    def dispatch(self, uri, data, event_type):
+        for callback in self.listeners.get(uri, []):
+            try:
+                callback(data, event_type)
+            except Exception as e:
+                print("LCU EVENT ERROR:", uri, e)
+
+
+# --- Poll Scheduler ---
+class PollScheduler:
+    """Picks background_loop's next sleep from the gameflow phase; wake() cuts a sleep short."""
+
+    def __init__(self, intervals=None, default=DEFAULT_POLL_INTERVAL, backoff=DISCONNECTED_BACKOFF):
+        self.intervals = dict(PHASE_POLL_INTERVALS if intervals is None else intervals)
+        self.default = default
+        self.backoff_min, self.backoff_max = backoff
+        self.backoff = self.backoff_min
+        self.phase = None
+        self.interval = self.backoff_min
+        self.reason = "startup"
+        self.wake_event = threading.Event()
+
+    def set_phase(self, phase):
+        changed = phase != self.phase
+        self.phase = phase
+        if changed:
+            self.wake()
+
+    def wake(self):
+        self.wake_event.set()
+
+    def next_interval(self, connected, active, stats_due_in):
+        """Seconds until the next tick; None means paused until wake().
+
+        active: an auto feature needs the gameflow to be polled.
+        stats_due_in: seconds until the next stats refresh (<= 0 when due, None when there is none).
+        """
+        if not connected:
+            interval = self.backoff
+            self.backoff = min(self.backoff * 2, self.backoff_max)
+            self.phase = None
+            self.reason = "disconnected"
+        else:
+            self.backoff = self.backoff_min
+            if active:
+                interval = self.intervals.get(self.phase or "None", self.default)
+                self.reason = f"phase {self.phase or 'None'}"
+            else:
+                interval = None
+                self.reason = "paused"
+            if stats_due_in is not None and (interval is None or stats_due_in < interval):
+                interval = max(stats_due_in, 0)
+                self.reason += ", stats refresh due"
+        self.interval = interval
+        return interval
+
+    def sleep(self, interval):
+        """Waits for interval seconds (forever if None) or until wake(); True if woken early."""
+        woken = self.wake_event.wait(interval)
+        self.wake_event.clear()
+        return woken
+
+    def snapshot(self):
+        return {"phase": self.phase, "interval_s": self.interval, "reason": self.reason}
+
+
+# --- Champ Select State ---
+class ChampSelectState:
+    """Last champ-select snapshot with the local player's pending actions indexed by type.
+
+    sent remembers, per action id, whether the action was in progress when it was PATCHed, so session
+    updates (other players' hovers, timer phases) do not send the same action again.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.lock = threading.Lock()
+        self.session = None
+        self.session_key = None
+        self.pending = {}
+        self.sent = {}  # action id -> isInProgress when the PATCH went out
+
+    def reset(self):
+        with self.lock:
+            self.session = None
+            self.session_key = None
+            self.pending = {}
+            self.sent = {}
+
+    def fetch(self):
+        r = self.handler.request("GET", CHAMP_SELECT_URI)
+        if r and r.status_code == 200:
+            return r.json()
+        return None
+
+    def update(self, session):
+        key = (session.get("gameId"), session.get("localPlayerCellId"))
+        if key != self.session_key:
+            self.reset()
+        local_cell_id = session.get("localPlayerCellId")
+        pending = {}
+        for actions in session.get("actions", []):
+            for action in actions:
+                if action.get("actorCellId") == local_cell_id and not action.get("completed"):
+                    pending.setdefault(action.get("type"), {})[action["id"]] = action
+        with self.lock:
+            live_ids = {action_id for by_id in pending.values() for action_id in by_id}
+            # tamamlanan aksiyonları takip etmeye gerek yok
+            self.sent = {action_id: state for action_id, state in self.sent.items() if action_id in live_ids}
+            self.pending = pending
+            self.session = session
+            self.session_key = key
+
+    def needs_send(self, action, champion_id):
+        if action["id"] not in self.sent:
+            return True
+        # sıra geldi (erken PATCH sadece hover olarak kabul edilmiş olabilir)
+        if action.get("isInProgress") and not self.sent[action["id"]]:
+            return True
+        # başka bir şampiyon seçilmiş
+        return action.get("championId") not in (0, None, champion_id)
+
+    def take_new(self, action_type, champion_id):
+        """Pending actions of this type that were never sent or changed state since; they are marked sent."""
+        with self.lock:
+            new = [
+                action for action in self.pending.get(action_type, {}).values()
+                if self.needs_send(action, champion_id)
+            ]
+            for action in new:
+                self.sent[action["id"]] = bool(action.get("isInProgress"))
+        return new
+
+    def release(self, action_id):
+        # PATCH başarısız oldu, bir sonraki snapshot'ta tekrar denensin
+        with self.lock:
+            self.sent.pop(action_id, None)
+
+
+lcu_handler = LCUHandler()
@@ -0,0 +1,97 @@
+import os
+import sys
+import threading
+import time
+from startup import lazy_import
+from lcu import LockfileWatcher, LOCKFILE_NAME
+
+requests = lazy_import("requests")
+urllib3 = lazy_import("urllib3")
+
+# no session yet -> 404 (login form is up), logged in -> 200
+RSO_AUTH_URI = "/rso-auth/v1/authorization"
+
+RIOT_CLIENT_READY_TIMEOUT = 30.0
+RIOT_CLIENT_POLL_INTERVAL = 0.25
+# API cevap verdikten sonra giriş ekranının çizilmesi için kısa pay
+RIOT_CLIENT_SETTLE = 1.0
+
+LOGIN_READY = "login"
+LOGGED_IN = "logged_in"
+
+
+def riot_client_config_dir():
+    """Folder of the Riot Client's own lockfile (not the League client's)."""
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Application Support/Riot Games/Riot Client/Config")
+    return os.path.join(os.environ.get("LOCALAPPDATA", ""), "Riot Games", "Riot Client", "Config")
+
+
+class RiotClientReadiness:
+    """Waits after a launch until the Riot Client's lockfile and local API are up.
+
+    wait() returns LOGIN_READY when the login form can take input, LOGGED_IN when a session
+    already exists, or None on timeout.
+    """
+
+    def __init__(self, config_dir=None, timeout=RIOT_CLIENT_READY_TIMEOUT,
+                 poll_interval=RIOT_CLIENT_POLL_INTERVAL, settle=RIOT_CLIENT_SETTLE):
+        self.config_dir = config_dir or riot_client_config_dir()
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.settle = settle
+        self.credentials = None
+        self.lockfile_seen = threading.Event()
+        self.cancelled = threading.Event()
+
+    def find_dir(self):
+        return self.config_dir if os.path.isdir(self.config_dir) else None
+
+    def on_lockfile(self, credentials):
+        self.credentials = credentials
+        if credentials:
+            self.lockfile_seen.set()
+        else:
+            self.lockfile_seen.clear()
+
+    def probe(self, credentials):
+        """HTTP status of the RSO auth endpoint, or None while the API is not answering."""
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        url = f"{credentials['protocol']}://127.0.0.1:{credentials['port']}{RSO_AUTH_URI}"
+        try:
+            r = requests.get(url, auth=("riot", credentials["password"]), verify=False, timeout=1)
+            return r.status_code
+        except requests.RequestException:
+            return None
+
+    def cancel(self):
+        self.cancelled.set()
+        self.lockfile_seen.set()
+
+    def wait(self):
+        deadline = time.monotonic() + self.timeout
+        watcher = LockfileWatcher(
+            self.find_dir, name=LOCKFILE_NAME,
+            poll_interval=self.poll_interval, discover_interval=self.poll_interval
+        )
+        watcher.subscribe(self.on_lockfile)
+        watcher.start()
+        try:
+            while not self.cancelled.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.lockfile_seen.wait(remaining):
+                    return None
+                credentials = self.credentials
+                if credentials is None or self.cancelled.is_set():
+                    continue
+                status = self.probe(credentials)
+                if status == 200:
+                    return LOGGED_IN
+                if status == 404:
+                    self.cancelled.wait(self.settle)
+                    return None if self.cancelled.is_set() else LOGIN_READY
+                # eski lockfile ya da API henüz ayakta değil
+                self.cancelled.wait(self.poll_interval)
+            return None
+        finally:
+            watcher.stop()
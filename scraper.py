@@ -0,0 +1,588 @@
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from startup import lazy_import
+from utils import CACHE_DIR, normalize_id
+
+requests = lazy_import("requests")
+bs4 = lazy_import("bs4")
+fake_useragent = lazy_import("fake_useragent")
+# async motor opsiyonel, yoksa thread havuzu kullanılır
+aiohttp = lazy_import("aiohttp", optional=True)
+etree = lazy_import("lxml.etree", optional=True)
+
+LOG_REGIONS = {"TR1": "tr", "EUW1": "euw", "EUN1": "eune", "NA1": "na"}
+
+# bulk check defaults, overridable from config.json
+SCRAPE_WORKERS = 4
+SCRAPE_RATE = 2.0  # requests / second
+SCRAPE_BURST = 4
+SCRAPE_RETRIES = 3
+SCRAPE_BACKOFF = 1.0  # seconds, doubled per retry
+SCRAPE_TIMEOUT = 5
+
+# the only nodes we read from a profile page
+TIER_CLASS = "leagueTier"
+LP_CLASS = "league-points"
+WINRATE_CLASS = "pie-chart-wrapper"
+RANK_CLASSES = (TIER_CLASS, LP_CLASS, WINRATE_CLASS)
+PARSE_CHUNK_SIZE = 4 * 1024
+# a start tag whose class attribute holds one of RANK_CLASSES
+RANK_TAG_RE = re.compile(
+    r"""<[a-zA-Z][^>]*\bclass\s*=\s*["']?[^"'>]*(?<![\w-])(?:%s)(?![\w-])"""
+    % "|".join(map(re.escape, RANK_CLASSES))
+)
+RAW_TEXT_OPEN_RE = re.compile(r"<(script|style)\b[^>]*>", re.I)
+
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr"
+}
+
+RANK_CACHE_FILE = os.path.join(CACHE_DIR, "ranks.json")
+RANK_CACHE_TTL = 30 * 60  # seconds
+
+_user_agent = None
+_user_agent_lock = threading.Lock()
+
+
+class ScrapeHTTPError(Exception):
+    def __init__(self, status, url, retry_after=None):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self):
+        return self.status == 429 or self.status >= 500
+
+
+def build_profile_url(server, riot_id):
+    if "#" not in riot_id:
+        return None
+    name, tag = riot_id.split("#", 1)
+    region = LOG_REGIONS.get(server, "tr")
+    # "Name-Tag" yapıp URL encode et
+    slug = urllib.parse.quote(f"{name}-{tag}", safe="")
+    return f"https://www.leagueofgraphs.com/summoner/{region}/{slug}"
+
+
+def parse_retry_after(value):
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def random_user_agent():
+    # UserAgent() yüklemesi pahalı, bir kez oluşturup paylaş
+    global _user_agent
+    with _user_agent_lock:
+        if _user_agent is None:
+            _user_agent = fake_useragent.UserAgent()
+    return _user_agent.random
+
+
+def parse_rank_html_soup(html):
+    """Full BeautifulSoup parse; kept as the reference implementation for the benchmark."""
+    soup = bs4.BeautifulSoup(html, 'html.parser')
+    tier_elem = soup.find(class_=TIER_CLASS)
+    lp_elem = soup.find(class_=LP_CLASS)
+    wr_elem = soup.find(class_=WINRATE_CLASS)
+    return build_rank_result(
+        tier_elem.text if tier_elem else None,
+        lp_elem.text if lp_elem else None,
+        wr_elem.get("data-percentage") if wr_elem else None
+    )
+
+
+def build_rank_result(tier_text, lp_text, winrate_pct):
+    if tier_text is not None:
+        full_rank = tier_text.strip().upper()
+        parts = full_rank.split()
+        tier = parts[0]
+        div = parts[1] if len(parts) > 1 else ""
+        lp = 0
+
+        if lp_text is not None:
+            lp = int(re.sub(r'[^0-9]', '', lp_text.strip()) or 0)
+
+        wr_text = ""
+        if winrate_pct:
+            wr_text = f"%{winrate_pct} Win Rate"
+
+        return {"rank_tier": tier, "rank_div": div, "lp": lp, "winrate": wr_text}
+
+    return {"rank_tier": "UNRANKED", "rank_div": "", "lp": 0, "winrate": ""}
+
+
+class _ExtractionDone(Exception):
+    pass
+
+
+class RankFieldExtractor(HTMLParser):
+    """Streams HTML and records the text / data-percentage of the first element of each rank class."""
+
+    def __init__(self):
+        super().__init__()
+        self.found = {}
+        self.capturing = []  # [class_name, open tag stack, text parts]
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in VOID_ELEMENTS:
+            for capture in self.capturing:
+                capture[1].append(tag)
+        classes = None
+        for name, value in attrs:
+            if name == "class" and value:
+                classes = value.split()
+                break
+        if not classes:
+            return
+        for cls in RANK_CLASSES:
+            if cls in classes and cls not in self.found:
+                if cls == WINRATE_CLASS:
+                    self.found[cls] = dict(attrs).get("data-percentage")
+                elif tag in VOID_ELEMENTS:
+                    self.found[cls] = ""
+                else:
+                    self.capturing.append([cls, [tag], []])
+        self.check_done()
+
+    def handle_startendtag(self, tag, attrs):
+        # <div ... /> kendini kapatan etiketler yığında kalmaz
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if not self.capturing or tag in VOID_ELEMENTS:
+            return
+        still_open = []
+        for capture in self.capturing:
+            stack = capture[1]
+            if tag in stack:
+                # kapanmamış iç etiketler (<p> gibi) eşleşen etiketle birlikte kapanır
+                del stack[len(stack) - 1 - stack[::-1].index(tag):]
+            if stack:
+                still_open.append(capture)
+            else:
+                self.found[capture[0]] = "".join(capture[2])
+        self.capturing = still_open
+        self.check_done()
+
+    def handle_data(self, data):
+        for capture in self.capturing:
+            capture[2].append(data)
+
+    def check_done(self):
+        if len(self.found) == len(RANK_CLASSES) and not self.capturing:
+            raise _ExtractionDone()
+
+
+def first_marker_offset(html):
+    """Offset of the first real tag carrying a rank class, so the page head is never parsed.
+
+    Matches inside <script>/<style> text (JS strings, CSS selectors) or plain text are skipped.
+    """
+    pos = 0
+    while True:
+        hits = [p for p in (html.find(cls, pos) for cls in RANK_CLASSES) if p != -1]
+        if not hits:
+            return None
+        hit = min(hits)
+        raw = RAW_TEXT_OPEN_RE.search(html, pos, hit)
+        if raw is not None:
+            # arada bir script/style bloğu var; eşleşme onun içinde olabilir, bloğun sonundan devam et
+            close = re.compile(rf"</{raw.group(1)}\s*>", re.I).search(html, raw.end())
+            if close is None:
+                return None
+            pos = close.end()
+            continue
+        start = html.rfind("<", pos, hit)
+        m = RANK_TAG_RE.match(html, start) if start != -1 else None
+        if m is not None and m.end() > hit:
+            return start
+        pos = hit + 1
+
+
+def extract_rank_fields_stdlib(html, start=0):
+    parser = RankFieldExtractor()
+    try:
+        for i in range(start, len(html), PARSE_CHUNK_SIZE):
+            parser.feed(html[i:i + PARSE_CHUNK_SIZE])
+        parser.close()
+    except _ExtractionDone:
+        pass
+    for cls, stack, parts in parser.capturing:
+        parser.found.setdefault(cls, "".join(parts))
+    return parser.found
+
+
+def extract_rank_fields_lxml(html, start=0):
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    found = {}
+    pending = {}
+    for i in range(start, len(html), PARSE_CHUNK_SIZE):
+        parser.feed(html[i:i + PARSE_CHUNK_SIZE])
+        for event, elem in parser.read_events():
+            if event == "start":
+                classes = (elem.get("class") or "").split()
+                for cls in RANK_CLASSES:
+                    if cls in classes and cls not in found and cls not in pending.values():
+                        if cls == WINRATE_CLASS:
+                            found[cls] = elem.get("data-percentage")
+                        else:
+                            pending[elem] = cls
+            elif elem in pending:
+                found[pending.pop(elem)] = "".join(elem.itertext())
+        if len(found) == len(RANK_CLASSES) and not pending:
+            return found
+    parser.close()
+    for elem, cls in pending.items():
+        found.setdefault(cls, "".join(elem.itertext()))
+    return found
+
+
+def extract_rank_fields(html, use_lxml=None):
+    """Returns {class name: text or data-percentage} for the rank nodes present in the page."""
+    start = first_marker_offset(html)
+    if start is None:
+        return {}
+    if use_lxml is None:
+        use_lxml = etree is not None
+    if use_lxml:
+        return extract_rank_fields_lxml(html, start)
+    return extract_rank_fields_stdlib(html, start)
+
+
+def parse_rank_html(html, use_lxml=None):
+    if TIER_CLASS not in html:
+        # tier yoksa sonuç zaten UNRANKED, sayfayı hiç parse etme
+        return build_rank_result(None, None, None)
+    fields = extract_rank_fields(html, use_lxml)
+    return build_rank_result(fields.get(TIER_CLASS), fields.get(LP_CLASS), fields.get(WINRATE_CLASS))
+
+
+class RankCache:
+    """Scraped rank results keyed by (server, normalized Riot ID), persisted under CACHE_DIR."""
+
+    def __init__(self, path=RANK_CACHE_FILE, ttl=RANK_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.entries = {}
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.load()
+
+    @staticmethod
+    def key(server, riot_id):
+        return f"{server}:{normalize_id(riot_id)}"
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.entries = data
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            data = dict(self.entries)
+            self.dirty = False
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def get(self, server, riot_id):
+        with self.lock:
+            return self.entries.get(self.key(server, riot_id))
+
+    def fresh_result(self, server, riot_id):
+        entry = self.get(server, riot_id)
+        if entry and time.time() - entry.get("fetched_at", 0) < self.ttl:
+            return entry.get("result")
+        return None
+
+    def conditional_headers(self, server, riot_id):
+        entry = self.get(server, riot_id)
+        headers = {}
+        if entry and entry.get("result"):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, server, riot_id, result, etag=None, last_modified=None):
+        with self.lock:
+            self.entries[self.key(server, riot_id)] = {
+                "result": result,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time()
+            }
+            self.dirty = True
+
+    def revalidated(self, server, riot_id):
+        """Server answered 304: bump the entry's age and return the cached result."""
+        with self.lock:
+            entry = self.entries.get(self.key(server, riot_id))
+            if not entry:
+                return None
+            entry["fetched_at"] = time.time()
+            self.dirty = True
+            return entry.get("result")
+
+
+def scrape_rank(server, riot_id, session=None, cache=None):
+    """Like fetch_rank_without_api but raises ScrapeHTTPError / requests errors instead of swallowing them."""
+    url = build_profile_url(server, riot_id)
+    if not url:
+        return None
+    headers = {"User-Agent": random_user_agent()}
+    if cache:
+        headers.update(cache.conditional_headers(server, riot_id))
+    response = (session or requests).get(url, headers=headers, timeout=SCRAPE_TIMEOUT)
+    if response.status_code == 304 and cache:
+        result = cache.revalidated(server, riot_id)
+        if result is not None:
+            return result
+    if response.status_code != 200:
+        raise ScrapeHTTPError(response.status_code, url, parse_retry_after(response.headers.get("Retry-After")))
+    result = parse_rank_html(response.text)
+    if cache:
+        cache.store(server, riot_id, result, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return result
+
+
+def fetch_rank_without_api(server, riot_id, session=None, cache=None):
+    """League of Graphs üzerinden rank çekme"""
+    try:
+        return scrape_rank(server, riot_id, session, cache)
+    except ScrapeHTTPError as e:
+        print("LoG SCRAPE ERROR:", e.status, e.url)
+        return None
+    except Exception as e:
+        print("LoG SCRAPE EXCEPTION:", e)
+        return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve a token and sleep until it is theirs."""
+
+    def __init__(self, rate, burst):
+        self.rate = max(float(rate), 0.01)
+        self.burst = max(float(burst), 1.0)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RankCheckPool:
+    """Runs rank scrapes on a bounded worker pool behind one global rate limit."""
+
+    def __init__(self, workers=SCRAPE_WORKERS, rate=SCRAPE_RATE, burst=SCRAPE_BURST,
+                 retries=SCRAPE_RETRIES, backoff=SCRAPE_BACKOFF, cache=None):
+        self.workers = max(1, int(workers))
+        self.bucket = TokenBucket(rate, burst)
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        self.session.mount("https://", adapter)
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+    def check(self, acc):
+        riot_id = acc.get('riot_id', '')
+        if self.cache:
+            cached = self.cache.fresh_result(acc['server'], riot_id)
+            if cached is not None:
+                return acc, cached, None
+        error = None
+        for attempt in range(self.retries + 1):
+            if self.stopped:
+                break
+            self.bucket.acquire()
+            try:
+                return acc, scrape_rank(acc['server'], riot_id, self.session, self.cache), None
+            except ScrapeHTTPError as e:
+                error = e
+                if not e.retryable:
+                    break
+                delay = e.retry_after if e.retry_after is not None else self.backoff * (2 ** attempt)
+            except requests.RequestException as e:
+                error = e
+                delay = self.backoff * (2 ** attempt)
+            except Exception as e:
+                return acc, None, e
+            if attempt < self.retries:
+                time.sleep(delay)
+        return acc, None, error
+
+    def run(self, accounts, on_batch, batch_size=10):
+        """Calls on_batch(list of (acc, result, error)) from this thread as results complete."""
+        batch = []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self.check, acc) for acc in accounts]
+            for future in as_completed(futures):
+                batch.append(future.result())
+                if len(batch) >= batch_size:
+                    on_batch(batch)
+                    batch = []
+                if self.stopped:
+                    for f in futures:
+                        f.cancel()
+                    break
+        if batch:
+            on_batch(batch)
+        if self.cache:
+            self.cache.save()
+
+
+class AsyncRankScraper:
+    """asyncio counterpart of RankCheckPool on a shared keep-alive aiohttp connection pool."""
+
+    def __init__(self, workers=SCRAPE_WORKERS, rate=SCRAPE_RATE, burst=SCRAPE_BURST,
+                 retries=SCRAPE_RETRIES, backoff=SCRAPE_BACKOFF, cache=None):
+        self.workers = max(1, int(workers))
+        self.bucket = TokenBucket(rate, burst)
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+    async def fetch_one(self, http, limiter, acc):
+        server, riot_id = acc['server'], acc.get('riot_id', '')
+        url = build_profile_url(server, riot_id)
+        if not url:
+            return acc, None
+        if self.cache:
+            cached = self.cache.fresh_result(server, riot_id)
+            if cached is not None:
+                return acc, cached
+        error = None
+        async with limiter:
+            for attempt in range(self.retries + 1):
+                if self.stopped:
+                    break
+                wait = self.bucket.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                headers = {"User-Agent": random_user_agent()}
+                if self.cache:
+                    headers.update(self.cache.conditional_headers(server, riot_id))
+                try:
+                    async with http.get(url, headers=headers) as response:
+                        if response.status == 304 and self.cache:
+                            result = self.cache.revalidated(server, riot_id)
+                            if result is not None:
+                                return acc, result
+                        if response.status == 200:
+                            html = await response.text()
+                            loop = asyncio.get_running_loop()
+                            result = await loop.run_in_executor(None, parse_rank_html, html)
+                            if self.cache:
+                                self.cache.store(
+                                    server, riot_id, result,
+                                    response.headers.get("ETag"), response.headers.get("Last-Modified")
+                                )
+                            return acc, result
+                        error = ScrapeHTTPError(
+                            response.status, url, parse_retry_after(response.headers.get("Retry-After"))
+                        )
+                    if not error.retryable:
+                        break
+                    delay = error.retry_after if error.retry_after is not None else self.backoff * (2 ** attempt)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = e
+                    delay = self.backoff * (2 ** attempt)
+                except Exception as e:
+                    return acc, e
+                if attempt < self.retries:
+                    await asyncio.sleep(delay)
+        return acc, error
+
+    async def fetch_ranks(self, accounts):
+        """Yields (acc, result) as each profile completes.
+
+        result is the parsed rank dict, None when the Riot ID cannot be looked up,
+        or the exception that ended the retries for that account.
+        """
+        connector = aiohttp.TCPConnector(limit=self.workers, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=SCRAPE_TIMEOUT)
+        limiter = asyncio.Semaphore(self.workers)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http:
+            tasks = [asyncio.ensure_future(self.fetch_one(http, limiter, acc)) for acc in accounts]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+                    if self.stopped:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def run(self, accounts, on_batch, batch_size=10):
+        """Same contract as RankCheckPool.run, driven by fetch_ranks on a private event loop."""
+        async def consume():
+            batch = []
+            async for acc, result in self.fetch_ranks(accounts):
+                if isinstance(result, Exception):
+                    batch.append((acc, None, result))
+                else:
+                    batch.append((acc, result, None))
+                if len(batch) >= batch_size:
+                    on_batch(batch)
+                    batch = []
+            if batch:
+                on_batch(batch)
+
+        asyncio.run(consume())
+        if self.cache:
+            self.cache.save()
+
+
+rank_cache = RankCache()
+
+
+def make_rank_checker(**kwargs):
+    if aiohttp is not None:
+        return AsyncRankScraper(**kwargs)
+    return RankCheckPool(**kwargs)
@@ -0,0 +1,150 @@
+import threading
+import unicodedata
+from bisect import bisect_left
+from utils import RANK_ORDER, normalize_id
+
+TURKISH_FOLD = str.maketrans({
+    "ı": "i", "İ": "i", "ğ": "g", "Ğ": "g",
+    "ü": "u", "Ü": "u", "ş": "s", "Ş": "s",
+    "ö": "o", "Ö": "o", "ç": "c", "Ç": "c",
+})
+
+DIVISION_SCORE = {"I": 300, "II": 200, "III": 100, "IV": 0}
+
+# fields that feed search_text, rank_score, the server bucket or the Riot ID lookup
+INDEXED_FIELDS = frozenset({"riot_id", "login_id", "note", "server", "rank_tier", "rank_div", "lp"})
+
+
+def fold_text(text):
+    """normalize_id-style folding (case, Turkish letters, accents) that keeps spaces for substring search."""
+    text = (text or "").lower().translate(TURKISH_FOLD)
+    if text.isascii():
+        return text
+    return ''.join(
+        ch for ch in unicodedata.normalize("NFD", text)
+        if unicodedata.category(ch) != "Mn"
+    )
+
+
+def rank_score(acc):
+    tier = acc.get("rank_tier", "UNRANKED")
+    base = RANK_ORDER.get(tier, -1)
+    div = DIVISION_SCORE.get(acc.get("rank_div", "IV"), 0)
+    return base + div + acc.get("lp", 0)
+
+
+class AccountSearchIndex:
+    """Per-server buckets of precomputed search text, with the rank-sorted order cached until a change."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = {}  # server -> {id(acc): (acc, text, score)}
+        self.server_of = {}  # id(acc) -> server
+        self.sorted_cache = {}  # (server, descending) -> [(acc, text)]
+        self.riot_ids = {}  # normalize_id(riot_id) -> [acc, ...] in insertion order
+        self.riot_key_of = {}  # id(acc) -> normalized riot id
+
+    @staticmethod
+    def search_text(acc):
+        return fold_text(f"{acc['riot_id']} {acc.get('rank_tier','')} {acc.get('note','')} {acc['login_id']}")
+
+    def rebuild(self, accounts):
+        with self.lock:
+            self.buckets = {}
+            self.server_of = {}
+            self.sorted_cache = {}
+            self.riot_ids = {}
+            self.riot_key_of = {}
+        for acc in accounts:
+            self.update(acc)
+
+    def update(self, acc):
+        key = id(acc)
+        server = acc.get("server")
+        entry = (acc, self.search_text(acc), rank_score(acc))
+        with self.lock:
+            old_server = self.server_of.get(key)
+            if old_server is not None and old_server != server:
+                self.buckets[old_server].pop(key, None)
+                self.invalidate(old_server)
+            self.buckets.setdefault(server, {})[key] = entry
+            self.server_of[key] = server
+            self.invalidate(server)
+            riot_key = normalize_id(acc.get("riot_id"))
+            old_riot_key = self.riot_key_of.get(key)
+            if old_riot_key != riot_key:
+                if old_riot_key is not None:
+                    self.drop_riot_id(old_riot_key, acc)
+                self.riot_ids.setdefault(riot_key, []).append(acc)
+                self.riot_key_of[key] = riot_key
+
+    def remove(self, acc):
+        key = id(acc)
+        with self.lock:
+            server = self.server_of.pop(key, None)
+            if server is not None:
+                self.buckets[server].pop(key, None)
+                self.invalidate(server)
+            riot_key = self.riot_key_of.pop(key, None)
+            if riot_key is not None:
+                self.drop_riot_id(riot_key, acc)
+
+    def drop_riot_id(self, riot_key, acc):
+        matches = [a for a in self.riot_ids.get(riot_key, []) if a is not acc]
+        if matches:
+            self.riot_ids[riot_key] = matches
+        else:
+            self.riot_ids.pop(riot_key, None)
+
+    def find_by_riot_id(self, riot_id, server=None):
+        """First account whose Riot ID matches after normalize_id folding, optionally on one server."""
+        with self.lock:
+            for acc in self.riot_ids.get(normalize_id(riot_id), []):
+                if server is None or acc.get("server") == server:
+                    return acc
+        return None
+
+    def invalidate(self, server):
+        self.sorted_cache.pop((server, True), None)
+        self.sorted_cache.pop((server, False), None)
+
+    def ordered(self, server, descending):
+        with self.lock:
+            order = self.sorted_cache.get((server, descending))
+            if order is None:
+                entries = list(self.buckets.get(server, {}).values())
+                entries.sort(key=lambda e: e[2], reverse=descending)
+                order = [(acc, text) for acc, text, score in entries]
+                self.sorted_cache[(server, descending)] = order
+            return order
+
+    def query(self, server, text="", descending=True):
+        order = self.ordered(server, descending)
+        needle = fold_text(text)
+        if not needle:
+            return [acc for acc, _ in order]
+        return [acc for acc, haystack in order if needle in haystack]
+
+
+class ChampionIndex:
+    """Champion names sorted once by folded name; query() gives prefix matches first, then substring matches."""
+
+    def __init__(self, names):
+        entries = sorted((fold_text(name), name) for name in names)
+        self.keys = [key for key, _ in entries]
+        self.entries = entries
+        self.names = [name for _, name in entries]
+        self.last = ("", entries)  # son sorgu; yazmaya devam edilirse sadece onun sonuçları taranır
+
+    def query(self, text):
+        needle = fold_text(text).strip()
+        if not needle:
+            return self.names
+        last_needle, last_matches = self.last
+        candidates = last_matches if last_needle and needle.startswith(last_needle) else self.entries
+        matches = [entry for entry in candidates if needle in entry[0]]
+        self.last = (needle, matches)
+        lo = bisect_left(self.keys, needle)
+        hi = bisect_left(self.keys, needle + "\uffff", lo)
+        prefix = self.names[lo:hi]
+        return prefix + [name for key, name in matches if not key.startswith(needle)]
@@ -0,0 +1,98 @@
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PROCESS_START = time.perf_counter()
+
+
+class StartupReport:
+    """Collects import times and startup milestones; written out with --startup-report."""
+
+    def __init__(self):
+        self.imports = []
+        self.marks = {}
+        self.lock = threading.Lock()
+        self.enabled = "--startup-report" in sys.argv or bool(os.environ.get("LOLHUB_STARTUP_REPORT"))
+
+    def record_import(self, name, seconds, deferred):
+        with self.lock:
+            self.imports.append({
+                "module": name,
+                "ms": round(seconds * 1000, 1),
+                "deferred": deferred,
+                "at_ms": round((time.perf_counter() - PROCESS_START) * 1000, 1)
+            })
+
+    @contextmanager
+    def timing(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_import(name, time.perf_counter() - started, False)
+
+    def mark(self, label):
+        self.marks[label] = round((time.perf_counter() - PROCESS_START) * 1000, 1)
+
+    def as_dict(self):
+        with self.lock:
+            return {"marks_ms": dict(self.marks), "imports": list(self.imports)}
+
+    def finish(self, path):
+        """Marks first paint, prints a summary and writes the JSON report to path."""
+        self.mark("first_paint")
+        report = self.as_dict()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"STARTUP: first paint after {self.marks['first_paint']} ms")
+        for row in sorted(report["imports"], key=lambda r: r["ms"], reverse=True):
+            tag = " (deferred)" if row["deferred"] else ""
+            print(f"  {row['module']:<24} {row['ms']:>8} ms{tag}")
+
+
+startup_report = StartupReport()
+
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    startup_report.record_import(self._name, time.perf_counter() - started, True)
+                    self._module = module
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name, optional=False):
+    """Deferred import; optional modules that are not installed come back as None."""
+    if name in sys.modules:
+        return sys.modules[name]
+    if optional:
+        try:
+            if importlib.util.find_spec(name) is None:
+                return None
+        except ImportError:
+            return None
+    return LazyModule(name)
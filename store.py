@@ -0,0 +1,216 @@
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from utils import DATA_FILE, STORE_FILE
+
+
+def apply_account_defaults(acc):
+    # missing stat fields to safe defaults so UI doesn't get None/N/A
+    acc.setdefault("level", 0)
+    acc.setdefault("blue_essence", 0)
+    acc.setdefault("rp", 0)
+    acc.setdefault("skin_count", 0)
+    acc.setdefault("rank_tier", "UNRANKED")
+    acc.setdefault("rank_div", "")
+    acc.setdefault("lp", 0)
+    acc.setdefault("last_seen", "Unknown")
+    acc.setdefault("winrate", "")
+    return acc
+
+
+class AccountEvents:
+    """Fan-out of account changes: callback(kind, acc, keys) with kind "changed", "added", "removed" or "reset"."""
+
+    def __init__(self):
+        self.listeners = []
+
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def emit(self, kind, acc=None, keys=None):
+        for callback in list(self.listeners):
+            try:
+                callback(kind, acc, keys)
+            except Exception as e:
+                print("ACCOUNT EVENT ERROR:", kind, e)
+
+
+class Account(dict):
+    """Account record whose password stays encrypted until login_pw is first read.
+
+    The record keeps its own token; it is reused on save while login_pw still equals the password it
+    encrypts, so no two records share a token. Item assignment and update() report the keys whose value
+    actually changed to events.
+    """
+
+    def __init__(self, data, pw_token, cipher, events=None):
+        super().__init__(data)
+        self.pw_token = pw_token
+        self.pw_plain = None  # pw_token'ın karşılığı, çözüldükten/şifrelendikten sonra
+        self.cipher = cipher
+        self.events = events
+
+    def __missing__(self, key):
+        if key == 'login_pw' and self.pw_token is not None:
+            value = self.cipher.decrypt(self.pw_token)
+            self.pw_plain = value
+            dict.__setitem__(self, 'login_pw', value)
+            return value
+        raise KeyError(key)
+
+    def changed_keys(self, values):
+        return {k for k, v in values.items() if not dict.__contains__(self, k) or dict.__getitem__(self, k) != v}
+
+    def __setitem__(self, key, value):
+        changed = self.changed_keys({key: value})
+        super().__setitem__(key, value)
+        if changed and self.events:
+            self.events.emit("changed", self, changed)
+
+    def update(self, *args, **kwargs):
+        values = dict(*args, **kwargs)
+        changed = self.changed_keys(values)
+        super().update(values)
+        if changed and self.events:
+            self.events.emit("changed", self, changed)
+
+    def __contains__(self, key):
+        return super().__contains__(key) or (key == 'login_pw' and self.pw_token is not None)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def stored_token(self):
+        """Token of the current password, or None once login_pw was replaced."""
+        if self.pw_token is None:
+            return None
+        if not dict.__contains__(self, 'login_pw') or dict.__getitem__(self, 'login_pw') == self.pw_plain:
+            return self.pw_token
+        return None
+
+    def remember_token(self, password, token):
+        self.pw_token = token
+        self.pw_plain = password
+
+
+class AccountStore:
+    """SQLite-backed account list; save() only rewrites records that changed, in one transaction."""
+
+    def __init__(self, cipher, path=STORE_FILE, legacy_path=DATA_FILE, events=None):
+        self.cipher = cipher
+        self.events = events
+        self.path = path
+        self.legacy_path = legacy_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS accounts ("
+            "id TEXT PRIMARY KEY, position INTEGER NOT NULL, data TEXT NOT NULL)"
+        )
+        self.conn.commit()
+        # id -> (position, row json) as last written, to diff against on save
+        self.written = {}
+
+    def encode(self, acc):
+        """The row as stored; an Account keeps its token until its password changes, plain dicts get a fresh one."""
+        if isinstance(acc, Account):
+            token = acc.stored_token()
+            if token is None:
+                token = self.cipher.encrypt(acc['login_pw'])
+                acc.remember_token(acc['login_pw'], token)
+        else:
+            token = self.cipher.encrypt(acc['login_pw'])
+        safe_acc = dict(acc)
+        safe_acc['login_pw'] = token
+        return json.dumps(safe_acc, sort_keys=True, ensure_ascii=False)
+
+    def migrate_legacy(self):
+        """One-time import of the old accounts_db.json; the file is kept as .bak."""
+        if not self.legacy_path or not os.path.exists(self.legacy_path):
+            return
+        with open(self.legacy_path, "r") as f:
+            data = json.load(f)
+        with self.lock, self.conn:
+            for position, acc in enumerate(data):
+                acc.setdefault("id", uuid.uuid4().hex)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO accounts (id, position, data) VALUES (?, ?, ?)",
+                    (acc["id"], position, json.dumps(acc, ensure_ascii=False))
+                )
+        os.replace(self.legacy_path, self.legacy_path + ".bak")
+
+    def load(self):
+        with self.lock:
+            empty = self.conn.execute("SELECT COUNT(*) FROM accounts").fetchone()[0] == 0
+        if empty:
+            self.migrate_legacy()
+        with self.lock:
+            rows = self.conn.execute("SELECT id, position, data FROM accounts ORDER BY position").fetchall()
+        accounts = []
+        self.written = {}
+        for acc_id, position, data in rows:
+            record = json.loads(data)
+            record["id"] = acc_id
+            acc = Account(record, record.pop('login_pw', ''), self.cipher, self.events)
+            self.written[acc_id] = (position, self.encode(acc))
+            accounts.append(acc)
+        return accounts
+
+    def adopt(self, data):
+        """Wraps a plain dict (new or imported account, plaintext password) so its changes are observed."""
+        if isinstance(data, Account):
+            return data
+        return Account(data, None, self.cipher, self.events)
+
+    def save(self, accounts):
+        """Writes new/changed accounts and drops removed ones; returns the number of rows touched."""
+        with self.lock:
+            changed = []
+            moved = []
+            seen = set()
+            for position, acc in enumerate(list(accounts)):
+                if "id" not in acc or acc["id"] in seen:
+                    acc["id"] = uuid.uuid4().hex
+                seen.add(acc["id"])
+                snap = self.encode(acc)
+                old = self.written.get(acc["id"])
+                if old is None or old[1] != snap:
+                    changed.append((acc, position, snap))
+                elif old[0] != position:
+                    # sadece sıra değişti, yeniden şifrelemeye gerek yok
+                    moved.append((acc["id"], position, snap))
+            removed = [acc_id for acc_id in self.written if acc_id not in seen]
+            if not changed and not moved and not removed:
+                return 0
+
+            rows = [(acc["id"], position, snap) for acc, position, snap in changed]
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO accounts (id, position, data) VALUES (?, ?, ?)", rows
+                )
+                self.conn.executemany(
+                    "UPDATE accounts SET position = ? WHERE id = ?",
+                    [(position, acc_id) for acc_id, position, snap in moved]
+                )
+                self.conn.executemany("DELETE FROM accounts WHERE id = ?", [(acc_id,) for acc_id in removed])
+            for acc, position, snap in changed:
+                self.written[acc["id"]] = (position, snap)
+            for acc_id, position, snap in moved:
+                self.written[acc_id] = (position, snap)
+            for acc_id in removed:
+                self.written.pop(acc_id, None)
+            return len(changed) + len(moved) + len(removed)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
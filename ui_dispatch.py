@@ -0,0 +1,93 @@
+import threading
+import time
+from collections import deque
+
+# how often the Tk thread drains the queue, and how long one drain may run
+UI_DRAIN_MS = 50
+UI_DRAIN_BUDGET_MS = 30
+# lines kept in a RingLog textbox
+RING_LOG_LINES = 500
+
+
+class UIDispatcher:
+    """Worker threads post callbacks here; the Tk thread runs them every UI_DRAIN_MS via after().
+
+    post() keeps every callback in order. post_latest() keeps only the newest callback per key,
+    for progress/status updates that would be overwritten anyway.
+    """
+
+    def __init__(self, root, interval_ms=UI_DRAIN_MS, budget_ms=UI_DRAIN_BUDGET_MS):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.budget = budget_ms / 1000
+        self.queue = deque()
+        self.latest = {}
+        self.lock = threading.Lock()
+        self.running = False
+
+    def post(self, callback):
+        self.queue.append(callback)
+
+    def post_latest(self, key, callback):
+        with self.lock:
+            self.latest[key] = callback
+
+    def start(self):
+        if not self.running:
+            self.running = True
+            self.root.after(self.interval_ms, self.drain)
+
+    def stop(self):
+        self.running = False
+
+    def run(self, callback):
+        try:
+            callback()
+        except Exception as e:
+            print("UI DISPATCH ERROR:", e)
+
+    def drain(self):
+        started = time.perf_counter()
+        # bütçe dolarsa kalanlar bir sonraki tura kalır, arayüz donmaz
+        while self.queue and time.perf_counter() - started < self.budget:
+            self.run(self.queue.popleft())
+        if not self.queue:
+            with self.lock:
+                latest, self.latest = self.latest, {}
+            for callback in latest.values():
+                self.run(callback)
+        if self.running:
+            self.root.after(self.interval_ms, self.drain)
+
+
+class RingLog:
+    """Append-only log for a read-only textbox that keeps the last max_lines lines.
+
+    append() may be called from any thread; flush() (Tk thread) inserts everything pending at once.
+    """
+
+    def __init__(self, textbox, max_lines=RING_LOG_LINES):
+        self.textbox = textbox
+        self.max_lines = max_lines
+        self.pending = deque(maxlen=max_lines)
+        self.lines = 0
+        self.lock = threading.Lock()
+
+    def append(self, text):
+        with self.lock:
+            self.pending.append(text)
+
+    def flush(self):
+        with self.lock:
+            if not self.pending:
+                return
+            batch = list(self.pending)
+            self.pending.clear()
+        self.textbox.configure(state="normal")
+        self.textbox.insert("end", "\n".join(batch) + "\n")
+        self.lines += len(batch)
+        if self.lines > self.max_lines:
+            self.textbox.delete("1.0", f"{self.lines - self.max_lines + 1}.0")
+            self.lines = self.max_lines
+        self.textbox.see("end")
+        self.textbox.configure(state="disabled")
@@ -0,0 +1,60 @@
+import os
+import sys
+import unicodedata
+from functools import lru_cache
+
+# --- AYARLAR ---
+DATA_FILE = "accounts_db.json"
+STORE_FILE = "accounts.db"
+CONFIG_FILE = "config.json"
+KEY_FILE = "secret.key"
+CACHE_DIR = "assets/cache"
+
+RANK_ORDER = {
+    "CHALLENGER": 9000, "GRANDMASTER": 8000, "MASTER": 7000,
+    "DIAMOND": 6000, "EMERALD": 5000, "PLATINUM": 4000,
+    "GOLD": 3000, "SILVER": 2000, "BRONZE": 1000, "IRON": 0, "UNRANKED": -1
+}
+
+def resource_path(relative_path):
+    try:
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+def ensure_cache_dir():
+    if not os.path.exists(CACHE_DIR):
+        os.makedirs(CACHE_DIR)
+
+@lru_cache(maxsize=4096)
+def normalize_id(riot_id):
+    if not riot_id:
+        return ""
+    text = riot_id.strip().lower()
+    turkish_map = {
+        "ı": "i", "İ": "i", "ğ": "g", "Ğ": "g",
+        "ü": "u", "Ü": "u", "ş": "s", "Ş": "s",
+        "ö": "o", "Ö": "o", "ç": "c", "Ç": "c",
+    }
+    for k, v in turkish_map.items():
+        text = text.replace(k, v)
+    # remove combining marks (e.g. i + dot)
+    text = ''.join(
+        ch for ch in unicodedata.normalize("NFD", text)
+        if unicodedata.category(ch) != "Mn"
+    )
+    text = text.replace(" ", "")
+    return text
+
+def slugify_for_url(text):
+    """Türkçe karakterleri League of Graphs uyumlu hale getirir"""
+    replacements = {
+        "ı": "i", "İ": "i", "ğ": "g", "Ğ": "g",
+        "ü": "u", "Ü": "u", "ş": "s", "Ş": "s",
+        "ö": "o", "Ö": "o", "ç": "c", "Ç": "c",
+        " ": "+"
+    }
+    for search, replace in replacements.items():
+        text = text.replace(search, replace)
+    return text